@@ -0,0 +1,20 @@
+#!/bin/bash
+# Unit Test Runner
+# Runs the non-GTK suites across all cores, one worker per test file.
+# Falls back to a serial run when pytest-xdist is not installed.
+# Extra arguments go to pytest, e.g. "-m unit" for the pure model tests only.
+
+set -e
+
+cd "$(dirname "$0")"
+source .venv/bin/activate
+
+SUITES="tests/core tests/parsers tests/export tests/integrations tests/data"
+
+if python -c "import xdist" 2>/dev/null; then
+    # loadfile keeps each module (and its module-scoped fixtures) on one worker
+    pytest -n auto --dist loadfile $SUITES "$@"
+else
+    echo "pytest-xdist not installed; running serially"
+    pytest $SUITES "$@"
+fi
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Run the mode manager and model tests in-process for quick edit-test loops.
+
+Skips the coverage addopts from pyproject.toml. Extra arguments are passed
+to pytest, e.g. ``python scripts/fasttest_core.py -k conflict``. With
+``--loop``, the tests rerun each time Enter is pressed, in the same
+interpreter, after dropping the hyprbind and tests modules so edits are
+picked up.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGETS = [
+    str(ROOT / "tests" / "core" / "test_mode_manager.py"),
+    str(ROOT / "tests" / "core" / "test_models.py"),
+]
+
+
+def _run(extra):
+    """Run the core targets once and return pytest's exit code."""
+    return pytest.main(
+        [
+            "-q", "--no-header", "-p", "no:cacheprovider",
+            "-o", "addopts=", "--import-mode=importlib",
+            *TARGETS, *extra,
+        ]
+    )
+
+
+def _forget_project_modules():
+    """Drop hyprbind and tests modules so the next run re-imports them."""
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("hyprbind", "tests"):
+            del sys.modules[name]
+
+
+def main(argv):
+    """Run once, or rerun on every Enter when --loop is given."""
+    loop = "--loop" in argv
+    extra = [arg for arg in argv if arg != "--loop"]
+
+    code = _run(extra)
+    while loop:
+        try:
+            input("\nEnter to rerun, Ctrl-D to quit: ")
+        except (EOFError, KeyboardInterrupt):
+            break
+        _forget_project_modules()
+        code = _run(extra)
+    return code
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ROOT))
+    sys.exit(main(sys.argv[1:]))
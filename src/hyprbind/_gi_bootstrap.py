@@ -0,0 +1,16 @@
+"""Pin PyGObject namespace versions once for the whole application.
+
+Modules import GI namespaces from here instead of calling
+``gi.require_version`` themselves:
+
+    from hyprbind._gi_bootstrap import Gtk, Adw
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk  # noqa: E402
+
+__all__ = ["Adw", "Gdk", "Gio", "GLib", "GObject", "Gtk"]
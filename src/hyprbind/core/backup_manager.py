@@ -1,10 +1,18 @@
 """Backup system for configuration files with timestamping and restore functionality."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Set
+import errno
+import os
+import re
 import shutil
+import sys
+import tempfile
+import threading
 
 from hyprbind.core.logging_config import get_logger
 from hyprbind.core.validators import PathValidator
@@ -12,8 +20,175 @@ from hyprbind.core.constants import BACKUP_KEEP_COUNT
 
 logger = get_logger(__name__)
 
+# Default timestamp source (tests substitute a deterministic clock)
+_now = datetime.now
 
-@dataclass
+# Resolved once; Path.home() looks up the passwd database on every call
+_DEFAULT_BACKUP_DIR = Path.home() / ".config" / "hypr" / "config" / ".backups"
+
+# Overrides the default backup directory (lets test workers stay isolated)
+BACKUP_DIR_ENV = "HYPRBIND_BACKUP_DIR"
+
+# sendfile only accepts a regular file as output on Linux
+_HAVE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Durability levels for new backups: nothing, the directory entry, or data too
+FSYNC_POLICIES = ("none", "dir", "data")
+
+# Files up to this size are copied through a per-thread buffer
+_SMALL_FILE_LIMIT = 64 * 1024
+_thread_buffers = threading.local()
+
+# copy_file_range errors meaning "not possible here", not "copy failed"
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+)
+
+# Backup filename: <original name>.<YYYY-MM-DDTHH-MM-SS-ffffff>.backup
+# (older backups have no microsecond field)
+_BACKUP_NAME_RE = re.compile(
+    r"^(?P<orig>.+?)\.(?P<ts>\d{4}-\d{2}-\d{2})T(?P<hms>\d{2}-\d{2}-\d{2})"
+    r"(?:-(?P<us>\d{6}))?\.backup$"
+)
+
+
+@lru_cache(maxsize=None)
+def _have_copy_file_range() -> bool:
+    """Check once whether os.copy_file_range is available (Linux, Python 3.8+)."""
+    return sys.platform.startswith("linux") and hasattr(os, "copy_file_range")
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, remaining: int) -> int:
+    """Copy with copy_file_range, which can share extents on CoW filesystems.
+
+    Returns:
+        Offset reached; stops early if the kernel refuses the copy
+    """
+    while remaining > 0:
+        try:
+            copied = os.copy_file_range(
+                src_fd, dst_fd, remaining, offset_src=offset, offset_dst=offset
+            )
+        except OSError as e:
+            if e.errno in _COPY_RANGE_UNSUPPORTED:
+                break
+            raise
+        if copied == 0:
+            break
+        offset += copied
+        remaining -= copied
+    return offset
+
+
+def _send_range(src_fd: int, dst_fd: int, offset: int, remaining: int) -> int:
+    """Copy with sendfile, writing at the destination's file position.
+
+    Returns:
+        Offset reached
+    """
+    while remaining > 0:
+        sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+        if sent == 0:
+            break
+        offset += sent
+        remaining -= sent
+    return offset
+
+
+def _copy_small(src_fd: int, dst_fd: int, size: int) -> int:
+    """Copy a file that fits in one buffer with a single read and write.
+
+    Returns:
+        Offset reached
+    """
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None:
+        buf = _thread_buffers.buf = bytearray(_SMALL_FILE_LIMIT)
+    view = memoryview(buf)
+
+    offset = 0
+    while offset < size:
+        n = os.readv(src_fd, [view[offset:]])
+        if n == 0:
+            break
+        offset += n
+
+    written = 0
+    while written < offset:
+        written += os.write(dst_fd, view[written:offset])
+    return offset
+
+
+def _fsync_path(path: Path, directory: bool = False) -> None:
+    """Flush a file or directory entry to disk, ignoring unsupported platforms."""
+    flags = os.O_RDONLY
+    if directory:
+        if not hasattr(os, "O_DIRECTORY"):
+            return  # Directories can't be opened for fsync (Windows)
+        flags |= os.O_DIRECTORY
+
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src: Path, dst: Path, sync: bool = False) -> None:
+    """Copy file contents in-kernel, falling back to shutil.
+
+    Small files (most Hyprland configs) take one read and one write through
+    a reused buffer. Larger ones try copy_file_range (reflink/server-side
+    copy), then sendfile, then shutil.copyfile.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (created or truncated, given src's mode)
+        sync: fsync the destination's data before returning
+    """
+    if not (_have_copy_file_range() or _HAVE_SENDFILE):
+        shutil.copyfile(src, dst)
+        shutil.copymode(src, dst)
+        if sync:
+            _fsync_path(dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        mode = st.st_mode & 0o777
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            # O_CREAT applies the umask and leaves existing files' modes alone
+            os.fchmod(dst_fd, mode)
+            size = st.st_size
+            offset = 0
+            if size <= _SMALL_FILE_LIMIT:
+                offset = _copy_small(src_fd, dst_fd, size)
+            elif _have_copy_file_range():
+                offset = _copy_range(src_fd, dst_fd, offset, size)
+            if offset < size and _HAVE_SENDFILE:
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                try:
+                    offset = _send_range(src_fd, dst_fd, offset, size - offset)
+                except OSError as e:
+                    if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                        raise
+            copied_all = offset >= size
+            if copied_all and sync:
+                os.fsync(dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if not copied_all:
+        shutil.copyfile(src, dst)
+        if sync:
+            _fsync_path(dst)
+
+
+@dataclass(frozen=True, slots=True)
 class BackupInfo:
     """Information about a backup file."""
 
@@ -26,19 +201,45 @@ class BackupInfo:
 class BackupManager:
     """Manages timestamped backups of configuration files."""
 
-    def __init__(self, backup_dir: Path | None = None):
+    def __init__(
+        self,
+        backup_dir: Path | None = None,
+        fsync: str = "dir",
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """
         Initialize BackupManager.
 
         Args:
-            backup_dir: Directory to store backups (defaults to ~/.config/hypr/config/.backups)
+            backup_dir: Directory to store backups (defaults to $HYPRBIND_BACKUP_DIR,
+                then ~/.config/hypr/config/.backups)
+            fsync: Durability of new backups: "none", "dir" (fsync the backup
+                directory once per create or batch) or "data" (also fsync
+                each backup file)
+            clock: Source of backup timestamps (defaults to datetime.now)
+
+        Raises:
+            ValueError: If fsync is not one of FSYNC_POLICIES
         """
-        if backup_dir is None:
-            backup_dir = (
-                Path.home() / ".config" / "hypr" / "config" / ".backups"
-            )
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy: {fsync!r}")
 
+        if backup_dir is None:
+            env_dir = os.environ.get(BACKUP_DIR_ENV)
+            backup_dir = Path(env_dir) if env_dir else _DEFAULT_BACKUP_DIR
         self.backup_dir = backup_dir
+        self.fsync = fsync
+        self._clock = clock if clock is not None else _now
+
+        # Backups per original filename, newest first; built lazily by list_backups
+        self._index: Optional[Dict[str, List[BackupInfo]]] = None
+        self._index_lock = threading.Lock()
+        # Backup directory mtime the index reflects; a change means another
+        # manager or process added or removed entries
+        self._index_mtime_ns: Optional[int] = None
+
+        # Config names found to have no backups while the directory was missing
+        self._missing: Set[str] = set()
 
     def create_backup(
         self, config_path: Path, skip_validation: bool = False
@@ -57,6 +258,12 @@ class BackupManager:
             ValueError: If path fails security validation
             FileNotFoundError: If config_path doesn't exist
         """
+        backup_path = self._create_backup(config_path, skip_validation)
+        self._sync_backup_dir()
+        return backup_path
+
+    def _create_backup(self, config_path: Path, skip_validation: bool) -> Path:
+        """Copy one config into the backup directory without syncing the directory."""
         # Validate source path
         if not skip_validation:
             path_error = PathValidator.validate_local_path(config_path)
@@ -71,69 +278,180 @@ class BackupManager:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate timestamped filename
-        # Format: keybinds.conf.2025-11-13T14-30-00.backup
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        # Format: keybinds.conf.2025-11-13T14-30-00-123456.backup
+        now = self._clock()
+        timestamp = now.strftime("%Y-%m-%dT%H-%M-%S-%f")
         backup_name = f"{config_path.name}.{timestamp}.backup"
         backup_path = self.backup_dir / backup_name
 
+        # Entries made elsewhere must not be hidden by restamping the index below
+        if self._index is not None and not self._index_is_current():
+            self._index = None
+
         # Copy file to backup location
-        shutil.copy2(config_path, backup_path)
+        _copy_file(config_path, backup_path, sync=self.fsync == "data")
+
+        self._missing.discard(config_path.name)
+        if self._index is not None:
+            self._record_backup(
+                BackupInfo(
+                    path=backup_path,
+                    timestamp=now,
+                    size=backup_path.stat().st_size,
+                    original_name=config_path.name,
+                )
+            )
 
         return backup_path
 
-    def list_backups(self, config_path: Path) -> List[BackupInfo]:
+    def create_backups_batch(
+        self, config_paths: List[Path], skip_validation: bool = False
+    ) -> List[Path]:
         """
-        List all backups for a specific config file.
+        Back up several config files concurrently.
+
+        The copies are syscall-bound, so threads overlap their I/O.
 
         Args:
-            config_path: Path to config file
+            config_paths: Paths to config files to backup
+            skip_validation: Skip path validation (for testing)
 
         Returns:
-            List of BackupInfo objects, sorted newest first
+            Paths to created backup files, in the order of config_paths
+
+        Raises:
+            ValueError: If a path fails security validation
+            FileNotFoundError: If a config path doesn't exist
         """
-        if not self.backup_dir.exists():
+        if not config_paths:
             return []
 
-        config_name = config_path.name
-        backups = []
+        with ThreadPoolExecutor(max_workers=min(8, len(config_paths))) as executor:
+            backup_paths = list(
+                executor.map(
+                    lambda path: self._create_backup(path, skip_validation),
+                    config_paths,
+                )
+            )
 
-        # Find all backup files matching this config
-        # Pattern: keybinds.conf.YYYY-MM-DDTHH-MM-SS.backup
-        for backup_file in self.backup_dir.glob(f"{config_name}.*.backup"):
-            # Validate filename format
-            parts = backup_file.stem.split(".")
-            if len(parts) < 3:
-                continue  # Invalid format, skip
+        # One directory flush covers every entry created above
+        self._sync_backup_dir()
+        return backup_paths
+
+    def _sync_backup_dir(self) -> None:
+        """Flush new directory entries according to the fsync policy."""
+        if self.fsync == "none":
+            return
+        try:
+            _fsync_path(self.backup_dir, directory=True)
+        except OSError as e:
+            logger.debug("Could not fsync backup directory %s: %s", self.backup_dir, e)
+
+    def _record_backup(self, info: BackupInfo) -> None:
+        """Add a newly created backup to the index, replacing a same-named one."""
+        with self._index_lock:
+            if self._index is None:
+                return
+            backups = [
+                b for b in self._index.get(info.original_name, []) if b.path != info.path
+            ]
+            backups.append(info)
+            backups.sort(key=lambda b: b.timestamp, reverse=True)
+            self._index[info.original_name] = backups
+            self._index_mtime_ns = self._dir_mtime_ns()
+
+    def _dir_mtime_ns(self) -> Optional[int]:
+        """Return the backup directory's mtime, or None if it is missing."""
+        try:
+            return os.stat(self.backup_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _index_is_current(self) -> bool:
+        """Check that the directory has not changed since the index was built.
+
+        Changes made through this manager refresh the stored mtime, so only
+        entries added or removed elsewhere force a rescan.
+        """
+        mtime_ns = self._dir_mtime_ns()
+        return mtime_ns is not None and mtime_ns == self._index_mtime_ns
+
+    def _build_index(self) -> Dict[str, List[BackupInfo]]:
+        """Scan the backup directory once, grouping backups by original filename."""
+        index: Dict[str, List[BackupInfo]] = {}
+        # Taken before the scan, so changes during it trigger a rescan later
+        self._index_mtime_ns = self._dir_mtime_ns()
+
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".backup"):
+                    continue  # Cheap reject before the regex
+
+                match = _BACKUP_NAME_RE.match(entry.name)
+                if not match or not entry.is_file():
+                    continue  # Not a backup file, skip
+
+                original_name = match["orig"]
+
+                # Parse timestamp (fromisoformat is implemented in C)
+                try:
+                    iso = f"{match['ts']}T{match['hms'].replace('-', ':')}"
+                    if match["us"]:
+                        iso += f".{match['us']}"
+                    timestamp = datetime.fromisoformat(iso)
+                except ValueError:
+                    continue  # Invalid timestamp format, skip
+
+                index.setdefault(original_name, []).append(
+                    BackupInfo(
+                        path=self.backup_dir / entry.name,
+                        timestamp=timestamp,
+                        # DirEntry caches its stat result for the entry's lifetime
+                        size=entry.stat().st_size,
+                        original_name=original_name,
+                    )
+                )
 
-            # Extract timestamp portion (last part before .backup)
-            timestamp_str = parts[-1]
+        # Sort by timestamp, newest first
+        for backups in index.values():
+            backups.sort(key=lambda b: b.timestamp, reverse=True)
 
-            # Verify it looks like a timestamp (19 chars, YYYY-MM-DDTHH-MM-SS)
-            if len(timestamp_str) != 19:
-                continue
+        return index
 
-            # Parse timestamp
-            try:
-                timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H-%M-%S")
-            except ValueError:
-                continue  # Invalid timestamp format, skip
+    def _known_missing(self, config_name: str) -> bool:
+        """Check a cached miss, dropping the cache once the directory exists.
 
-            # Get file size
-            size = backup_file.stat().st_size
+        Another manager or process may create the backup directory at any
+        time, so a miss only holds while the directory is still absent.
+        """
+        if config_name not in self._missing:
+            return False
+        if self.backup_dir.exists():
+            self._missing.clear()
+            return False
+        return True
 
-            backups.append(
-                BackupInfo(
-                    path=backup_file,
-                    timestamp=timestamp,
-                    size=size,
-                    original_name=config_name,
-                )
-            )
+    def list_backups(self, config_path: Path) -> List[BackupInfo]:
+        """
+        List all backups for a specific config file.
 
-        # Sort by timestamp, newest first
-        backups.sort(key=lambda b: b.timestamp, reverse=True)
+        Args:
+            config_path: Path to config file
 
-        return backups
+        Returns:
+            List of BackupInfo objects, sorted newest first
+        """
+        if self._index is not None and not self._index_is_current():
+            self._index = None
+        if self._index is None:
+            if self._known_missing(config_path.name):
+                return []
+            if not self.backup_dir.exists():
+                self._missing.add(config_path.name)
+                return []
+            self._index = self._build_index()
+
+        return list(self._index.get(config_path.name, []))
 
     def restore_backup(
         self, backup_path: Path, target_path: Path, skip_validation: bool = False
@@ -153,6 +471,9 @@ class BackupManager:
         if not backup_path.exists():
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
+        # Write through symlinks (stow/dotfile setups) instead of replacing them
+        target_path = target_path.resolve()
+
         # Validate target path before restoring
         if not skip_validation:
             path_error = PathValidator.validate_write_path(target_path)
@@ -163,8 +484,34 @@ class BackupManager:
         # Ensure target directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy backup to target location
-        shutil.copy2(backup_path, target_path)
+        # Copy into a sibling temp file, then swap it in atomically so the
+        # target is never seen half-written
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=target_path.parent,
+            prefix='.hyprbind_tmp_',
+            suffix='.conf'
+        )
+        os.close(temp_fd)
+
+        try:
+            _copy_file(backup_path, Path(temp_path))
+            # Keep the live config's permissions rather than the backup's
+            try:
+                os.chmod(temp_path, os.stat(target_path).st_mode & 0o777)
+            except FileNotFoundError:
+                pass  # New target keeps the backup's mode from _copy_file
+            os.replace(temp_path, target_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError as cleanup_error:
+                # Temp file cleanup is non-critical; log for debugging
+                logger.debug("Failed to cleanup temp file %s: %s", temp_path, cleanup_error)
+            raise
+
+        # The target may live in the backup directory
+        self._index = None
+        self._missing.clear()
 
     def cleanup_old_backups(self, config_path: Path, keep: int = BACKUP_KEEP_COUNT) -> int:
         """
@@ -177,6 +524,11 @@ class BackupManager:
         Returns:
             Number of backups deleted
         """
+        if self._known_missing(config_path.name):
+            return 0
+        if self._index is None:
+            return self._cleanup_unindexed(config_path.name, keep)
+
         backups = self.list_backups(config_path)
 
         if len(backups) <= keep:
@@ -184,6 +536,7 @@ class BackupManager:
 
         # Delete oldest backups (backups is sorted newest first)
         backups_to_delete = backups[keep:]
+        remaining = backups[:keep]
         deleted_count = 0
 
         for backup_info in backups_to_delete:
@@ -191,6 +544,55 @@ class BackupManager:
                 backup_info.path.unlink()
                 deleted_count += 1
             except Exception:
+                # Continue even if deletion fails
+                remaining.append(backup_info)
+
+        if self._index is not None:
+            self._index[config_path.name] = remaining
+            self._index_mtime_ns = self._dir_mtime_ns()
+
+        return deleted_count
+
+    def _cleanup_unindexed(self, config_name: str, keep: int) -> int:
+        """Delete old backups using filenames only, without building the index.
+
+        Timestamp fields in backup names sort chronologically as strings, so
+        no datetime parsing, stat call or BackupInfo is needed.
+
+        Args:
+            config_name: Filename of the config whose backups are pruned
+            keep: Number of backups to keep
+
+        Returns:
+            Number of backups deleted
+        """
+        try:
+            entries = os.scandir(self.backup_dir)
+        except FileNotFoundError:
+            return 0
+
+        candidates = []
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".backup"):
+                    continue
+                match = _BACKUP_NAME_RE.match(entry.name)
+                if match and match["orig"] == config_name:
+                    sort_key = (match["ts"], match["hms"], match["us"] or "")
+                    candidates.append((sort_key, entry.name))
+
+        if len(candidates) <= keep:
+            return 0
+
+        # Newest first, then delete the tail
+        candidates.sort(reverse=True)
+        deleted_count = 0
+
+        for _, name in candidates[keep:]:
+            try:
+                os.unlink(self.backup_dir / name)
+                deleted_count += 1
+            except OSError:
                 # Continue even if deletion fails
                 pass
 
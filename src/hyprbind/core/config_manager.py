@@ -14,6 +14,9 @@ from hyprbind.parsers.config_parser import ConfigParser
 
 logger = get_logger(__name__)
 
+# Resolved once; Path.home() looks up the passwd database on every call
+_DEFAULT_CONFIG_PATH = Path.home() / ".config" / "hypr" / "config" / "keybinds.conf"
+
 
 @dataclass
 class OperationResult:
@@ -37,15 +40,23 @@ class ConfigManager:
             config_path: Path to keybinds.conf (defaults to ~/.config/hypr/config/keybinds.conf)
             skip_validation: Skip path validation (for testing with tmp paths)
         """
-        if config_path is None:
-            config_path = Path.home() / ".config" / "hypr" / "config" / "keybinds.conf"
-
-        self.config_path = config_path
+        self.config_path = config_path if config_path is not None else _DEFAULT_CONFIG_PATH
         self.config: Optional[Config] = None
         self._observers: List[Callable[[], None]] = []
         self._dirty = False
         self._skip_validation = skip_validation
-        self.backup_manager = BackupManager()
+        self._backup_manager: Optional[BackupManager] = None
+
+    @property
+    def backup_manager(self) -> BackupManager:
+        """BackupManager for this config, created with defaults on first use."""
+        if self._backup_manager is None:
+            self._backup_manager = BackupManager()
+        return self._backup_manager
+
+    @backup_manager.setter
+    def backup_manager(self, manager: BackupManager) -> None:
+        self._backup_manager = manager
 
     def add_observer(self, callback: Callable[[], None]) -> None:
         """
@@ -121,7 +132,7 @@ class ConfigManager:
             return OperationResult(
                 success=False,
                 message=f"Binding conflicts with {len(conflicts)} existing binding(s)",
-                conflicts=conflicts,
+                conflicts=list(conflicts),
             )
 
         # No conflicts, add binding
@@ -177,30 +188,30 @@ class ConfigManager:
                 success=False, message="Config not loaded. Call load() first."
             )
 
-        # Save original dirty state in case we need to rollback
-        was_dirty = self._dirty
-
-        # Remove old binding (this sets dirty and notifies)
-        remove_result = self.remove_binding(old_binding)
-        if not remove_result.success:
-            return remove_result
-
-        # Try to add new binding (this sets dirty and notifies)
-        add_result = self.add_binding(new_binding)
-        if not add_result.success:
-            # Rollback: re-add old binding
-            self.config.add_binding(old_binding)
-            # Restore original dirty state
-            self._dirty = was_dirty
-            # Notify observers of rollback
-            self._notify_observers()
+        category = self.config.categories.get(old_binding.category)
+        if category is None or old_binding not in category.bindings:
+            return OperationResult(success=False, message="Binding not found")
+
+        # Journal the old position so a rollback restores it exactly
+        position = category.bindings.index(old_binding)
+        self.config.remove_binding(old_binding)
+
+        conflicts = ConflictDetector.check(new_binding, self.config)
+        if conflicts:
+            # Undo the removal; the config is unchanged, so nobody is notified
+            self.config.add_binding(old_binding, position=position)
             return OperationResult(
                 success=False,
-                message=f"Update failed: {add_result.message}. Changes rolled back.",
-                conflicts=add_result.conflicts,
+                message=(
+                    f"Update failed: Binding conflicts with {len(conflicts)} "
+                    "existing binding(s). Changes rolled back."
+                ),
+                conflicts=list(conflicts),
             )
 
-        # Success - dirty already set, observers already notified by add_binding
+        self.config.add_binding(new_binding)
+        self._dirty = True
+        self._notify_observers()
         return OperationResult(success=True, message="Binding updated")
 
     def save(self, output_path: Optional[Path] = None) -> OperationResult:
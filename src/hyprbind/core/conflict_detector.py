@@ -1,10 +1,14 @@
 """Detect keybinding conflicts."""
 
-from typing import List, Optional
+from typing import Tuple
 
 from hyprbind.core.models import Binding, Config
 
 
+# Shared result for the common no-conflict case
+_NO_CONFLICTS: Tuple[Binding, ...] = ()
+
+
 class ConflictDetector:
     """Detect conflicts between keybindings.
 
@@ -12,7 +16,7 @@ class ConflictDetector:
     """
 
     @staticmethod
-    def check(binding: Binding, config: Config) -> List[Binding]:
+    def check(binding: Binding, config: Config) -> Tuple[Binding, ...]:
         """
         Check if binding conflicts with existing bindings.
 
@@ -23,10 +27,10 @@ class ConflictDetector:
             config: Current configuration
 
         Returns:
-            List of conflicting bindings (empty if no conflicts)
+            Tuple of conflicting bindings (empty if no conflicts)
         """
         conflict = config.find_conflict(binding)
-        return [conflict] if conflict else []
+        return (conflict,) if conflict is not None else _NO_CONFLICTS
 
     @staticmethod
     def has_conflicts(binding: Binding, config: Config) -> bool:
@@ -40,4 +44,4 @@ class ConflictDetector:
         Returns:
             True if conflicts exist
         """
-        return config.find_conflict(binding) is not None
+        return config.has_conflict(binding)
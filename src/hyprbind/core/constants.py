@@ -51,10 +51,19 @@ VALID_MODIFIERS: FrozenSet[str] = frozenset([
 ])
 """Set of valid Hyprland modifier names."""
 
-VARIABLE_PATTERN = re.compile(r'^\$\w+$')
+VARIABLE_PATTERN = re.compile(r'\A\$\w+\Z')
 """Pattern matching Hyprland variable references like $mainMod."""
 
 
+def _is_variable_name(mod: str) -> bool:
+    """Check a $-prefixed string against VARIABLE_PATTERN without the regex.
+
+    str.isalnum() accepts exactly the characters \\w does apart from "_",
+    so swapping underscores for a letter gives the same answer in C.
+    """
+    return len(mod) > 1 and mod[1:].replace("_", "a").isalnum()
+
+
 def is_valid_modifier(mod: str) -> bool:
     """Check if a modifier is valid (built-in or variable reference).
 
@@ -72,4 +81,9 @@ def is_valid_modifier(mod: str) -> bool:
         >>> is_valid_modifier("INVALID")
         False
     """
-    return mod.upper() in VALID_MODIFIERS or bool(VARIABLE_PATTERN.match(mod))
+    if not mod:
+        return False
+    # Variable references get the character check; builtins are a set lookup
+    if mod[0] == "$":
+        return _is_variable_name(mod)
+    return mod.upper() in VALID_MODIFIERS
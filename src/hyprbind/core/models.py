@@ -2,7 +2,10 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+import sys
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 
 
 class BindType(Enum):
@@ -14,7 +17,22 @@ class BindType(Enum):
     BINDM = "bindm"  # Mouse binding
 
 
-@dataclass
+# Canonical modifier tuple per distinct modifier list seen; configs only use a
+# handful of combinations, so every binding shares one of a few tuples. The
+# bound keeps stray spellings from piling up for the life of the process.
+@lru_cache(maxsize=256)
+def _canonical_modifiers(modifiers: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the sorted, deduplicated modifier tuple used in conflict keys.
+
+    Builtin modifiers are case-insensitive ("super" == "SUPER"); $variables
+    are not.
+    """
+    return tuple(sorted({
+        m if m.startswith("$") else sys.intern(m.upper()) for m in modifiers
+    }))
+
+
+@dataclass(frozen=True, slots=True)
 class Binding:
     """Represents a single Hyprland keybinding."""
 
@@ -27,6 +45,60 @@ class Binding:
     submap: Optional[str]
     line_number: int
     category: str
+    # Derived once in __post_init__; modifiers must not be mutated afterwards
+    _conflict_key: tuple = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the repeated strings, then precompute the conflict key and hash.
+
+        ``modifiers`` may be passed as any sequence; it is stored as a new list.
+        """
+        # Configs repeat a handful of modifiers, keys and category names
+        # across hundreds of bindings; share one object per distinct string
+        modifiers = [sys.intern(m) for m in self.modifiers]
+        object.__setattr__(self, "modifiers", modifiers)
+        object.__setattr__(self, "key", sys.intern(self.key))
+        object.__setattr__(self, "category", sys.intern(self.category))
+        if self.submap is not None:
+            object.__setattr__(self, "submap", sys.intern(self.submap))
+
+        key = (_canonical_modifiers(tuple(modifiers)), self.key, self.submap)
+        object.__setattr__(self, "_conflict_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    def __reduce__(self):
+        """Pickle and copy by init fields only.
+
+        ``_hash`` depends on the interpreter's hash seed, so it is recomputed
+        by ``__post_init__`` on load rather than restored from the pickle.
+        """
+        return (self.__class__, (
+            self.type, self.modifiers, self.key, self.description, self.action,
+            self.params, self.submap, self.line_number, self.category,
+        ))
+
+    def __hash__(self) -> int:
+        """Hash by conflict key (equal bindings always share one)."""
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Field-wise equality, short-circuited by identity.
+
+        The key is compared first: in ``binding in category.bindings`` most
+        entries differ there, and tuple comparison stops at the first mismatch.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.key, self.modifiers, self.type, self.description, self.action,
+            self.params, self.submap, self.line_number, self.category,
+        ) == (
+            other.key, other.modifiers, other.type, other.description, other.action,
+            other.params, other.submap, other.line_number, other.category,
+        )
 
     @property
     def display_name(self) -> str:
@@ -53,25 +125,23 @@ class Binding:
         """
         Check if this binding conflicts with another.
 
-        Note: Modifier order is normalized, so 'SHIFT + SUPER' and 'SUPER + SHIFT'
-        are treated as the same combination.
+        Note: Modifier order and builtin modifier case are normalized, so
+        'SHIFT + SUPER', 'SUPER + SHIFT' and 'super + shift' are treated as the
+        same combination.
         """
-        # Sort modifiers to handle different orderings (SHIFT+SUPER == SUPER+SHIFT)
-        return (
-            sorted(self.modifiers) == sorted(other.modifiers)
-            and self.key == other.key
-            and self.submap == other.submap
-        )
+        return self._conflict_key == other._conflict_key
 
     @property
     def conflict_key(self) -> tuple:
-        """Generate hash key for conflict detection.
+        """Hash key for conflict detection, computed once at construction.
 
         Returns:
             Tuple of (sorted_modifiers, key, submap) for consistent hashing.
-            Modifiers are sorted to ensure 'SHIFT+SUPER' == 'SUPER+SHIFT'.
+            Modifiers are sorted and deduplicated to ensure
+            'SHIFT+SUPER' == 'SUPER+SHIFT', and builtin (non-$) modifiers are
+            upper-cased.
         """
-        return (tuple(sorted(self.modifiers)), self.key, self.submap)
+        return self._conflict_key
 
 
 @dataclass
@@ -96,16 +166,51 @@ class Config:
     original_content: str = ""
     _binding_index: dict[tuple, Binding] = field(default_factory=dict, repr=False)
 
-    def add_binding(self, binding: Binding) -> None:
+    @classmethod
+    def from_bindings(cls, bindings: List[Binding], **kwargs) -> "Config":
+        """Build a Config from parsed bindings in one pass.
+
+        Equivalent to calling add_binding() for each binding in order,
+        including last-wins index entries for duplicate key combinations.
+
+        Args:
+            bindings: Bindings in file order
+            **kwargs: Other Config fields (file_path, variables, ...)
+
+        Returns:
+            New Config with categories and index populated
+        """
+        config = cls(**kwargs)
+        categories = config.categories
+        for binding in bindings:
+            category = categories.get(binding.category)
+            if category is None:
+                category = categories[binding.category] = Category(name=binding.category)
+            category.bindings.append(binding)
+        config._binding_index = {binding.conflict_key: binding for binding in bindings}
+        return config
+
+    def add_binding(self, binding: Binding, position: Optional[int] = None) -> None:
         """Add binding to appropriate category and update index.
 
         Note: Caller should check for conflicts before adding (use find_conflict()).
         If a binding with the same conflict_key exists, this overwrites the index
-        entry - use ConfigManager.add_binding() for conflict-safe operations.
+        entry (last write wins; both stay in their categories) - use
+        ConfigManager.add_binding() for conflict-safe operations.
+
+        Args:
+            binding: Binding to add
+            position: Index within the category (appends if None)
         """
-        if binding.category not in self.categories:
-            self.categories[binding.category] = Category(name=binding.category)
-        self.categories[binding.category].bindings.append(binding)
+        # One probe on the common path; setdefault would build a Category every call
+        category = self.categories.get(binding.category)
+        if category is None:
+            category = self.categories[binding.category] = Category(name=binding.category)
+        bindings = category.bindings
+        if position is None:
+            bindings.append(binding)
+        else:
+            bindings.insert(position, binding)
         # Update conflict detection index
         self._binding_index[binding.conflict_key] = binding
 
@@ -129,6 +234,15 @@ class Config:
         """
         return self._binding_index.get(binding.conflict_key)
 
+    def has_conflict(self, binding: Binding) -> bool:
+        """Check whether any binding already uses this key combination."""
+        return binding.conflict_key in self._binding_index
+
+    @property
+    def binding_index(self) -> Mapping[tuple, Binding]:
+        """Read-only live view of the conflict index, keyed by conflict_key."""
+        return MappingProxyType(self._binding_index)
+
     def get_all_bindings(self) -> List[Binding]:
         """Get flat list of all bindings."""
         all_bindings = []
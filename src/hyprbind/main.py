@@ -1,14 +1,8 @@
 """Main entry point for HyprBind application."""
 
 import sys
-import gi
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Adw
-
-from hyprbind.ui.main_window import MainWindow
+from hyprbind._gi_bootstrap import Gtk, Adw
 
 
 def main() -> int:
@@ -20,6 +14,9 @@ def main() -> int:
 
 def on_activate(app: Adw.Application) -> None:
     """Handle application activation."""
+    # Imported here so the window template is only parsed when a window is needed
+    from hyprbind.ui.main_window import MainWindow
+
     window = MainWindow(application=app)
     window.present()
 
@@ -2,9 +2,9 @@
 
 import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from hyprbind.core.models import Config, Category
+from hyprbind.core.models import Binding, Config, Category
 from hyprbind.core.validators import PathValidator
 from hyprbind.core.logging_config import get_logger
 from hyprbind.parsers.binding_parser import BindingParser
@@ -31,8 +31,6 @@ class ConfigParser:
         Raises:
             ValueError: If path fails security validation
         """
-        config = Config(file_path=str(file_path))
-
         # Validate path is within allowed directories
         if not skip_validation:
             path_error = PathValidator.validate_local_path(file_path)
@@ -41,35 +39,18 @@ class ConfigParser:
                 raise ValueError(path_error)
 
         if not file_path.exists():
-            return config
+            return Config(file_path=str(file_path))
 
         with open(file_path, "r") as f:
             content = f.read()
-            config.original_content = content
-
-        # Load variables from config directory
-        config_dir = file_path.parent
-        config.variables = VariableResolver.load_all_variables(config_dir)
-
-        lines = content.split("\n")
-        current_category = "Uncategorized"
-
-        for line_num, line in enumerate(lines, start=1):
-            stripped = line.strip()
-
-            # Detect category from comments
-            # Pattern: # ======= Category Name =======
-            if stripped.startswith("#") and "=======" in stripped:
-                category_match = re.search(r"=+\s+(.+?)\s+=+", stripped)
-                if category_match:
-                    current_category = category_match.group(1).strip()
-
-            # Parse binding line
-            binding = BindingParser.parse_line(line, line_num, current_category)
-            if binding:
-                config.add_binding(binding)
 
-        return config
+        return Config.from_bindings(
+            ConfigParser._parse_bindings(content),
+            file_path=str(file_path),
+            original_content=content,
+            # Load variables from config directory
+            variables=VariableResolver.load_all_variables(file_path.parent),
+        )
 
     @staticmethod
     def parse_string(content: str) -> Config:
@@ -82,16 +63,28 @@ class ConfigParser:
         Returns:
             Config object with parsed bindings
         """
-        config = Config()
-        config.original_content = content
+        return Config.from_bindings(
+            ConfigParser._parse_bindings(content), original_content=content
+        )
+
+    @staticmethod
+    def _parse_bindings(content: str) -> List[Binding]:
+        """Parse every binding line, tracking the current category.
+
+        Args:
+            content: Config file text
 
-        lines = content.split("\n")
+        Returns:
+            Bindings in file order
+        """
+        bindings = []
         current_category = "Uncategorized"
 
-        for line_num, line in enumerate(lines, start=1):
+        for line_num, line in enumerate(content.split("\n"), start=1):
             stripped = line.strip()
 
             # Detect category from comments
+            # Pattern: # ======= Category Name =======
             if stripped.startswith("#") and "=======" in stripped:
                 category_match = re.search(r"=+\s+(.+?)\s+=+", stripped)
                 if category_match:
@@ -100,6 +93,6 @@ class ConfigParser:
             # Parse binding line
             binding = BindingParser.parse_line(line, line_num, current_category)
             if binding:
-                config.add_binding(binding)
+                bindings.append(binding)
 
-        return config
+        return bindings
@@ -1,10 +1,7 @@
 """Dynamic theme management for GTK4 application (Task 24)."""
 
 from typing import Optional
-import gi
-
-gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk
+from hyprbind._gi_bootstrap import Gtk, Gdk
 
 from hyprbind.theming.wallust_loader import ColorPalette
 from hyprbind.core.logging_config import get_logger
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict
+import json
 import shutil
 import re
 import os
@@ -94,6 +95,48 @@ class WallustLoader:
 
         return None
 
+    @staticmethod
+    def cache_file() -> Path:
+        """Path of the palette cache written after each successful load."""
+        xdg_cache = os.getenv("XDG_CACHE_HOME")
+        cache_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        return cache_dir / "hyprbind" / "wallust_palette.json"
+
+    @staticmethod
+    def load_cached_colors() -> Optional[ColorPalette]:
+        """Load the last known palette from the cache file.
+
+        This is a single file read with no Wallust probing, so it is cheap
+        enough to run before the first window is shown.
+
+        Returns:
+            Cached palette, or None if there is no usable cache
+        """
+        try:
+            data = json.loads(WallustLoader.cache_file().read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        return WallustLoader._colors_to_palette(data)
+
+    @staticmethod
+    def save_cached_colors(palette: ColorPalette) -> bool:
+        """Write palette to the cache file for the next startup.
+
+        Returns:
+            True if the cache was written, False otherwise
+        """
+        cache_file = WallustLoader.cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(palette.to_dict()))
+            return True
+        except OSError:
+            return False
+
     @staticmethod
     def _parse_hypr_colors(content: str) -> Dict[str, str]:
         """Parse Hyprland colors.conf format.
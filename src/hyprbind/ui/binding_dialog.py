@@ -1,11 +1,6 @@
 """Dialog for creating or editing a keybinding."""
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Adw
+from hyprbind._gi_bootstrap import Gtk, Adw
 from typing import Optional
 
 from hyprbind.core.config_manager import ConfigManager
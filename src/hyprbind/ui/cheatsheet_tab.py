@@ -1,16 +1,13 @@
 """Cheatsheet tab for viewing and exporting keybindings."""
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-
-from gi.repository import Gtk, Gio, GObject, GLib
+from hyprbind._gi_bootstrap import Gtk, Gio, GObject
 from typing import Optional
 from pathlib import Path
 
 from hyprbind.core.config_manager import ConfigManager
 from hyprbind.core.models import Binding
 from hyprbind.export.exporter import Exporter
+from hyprbind.ui.config_signals import ConfigChangeNotifier
 
 
 class BindingCardObject(GObject.Object):
@@ -60,9 +57,10 @@ class CheatsheetTab(Gtk.Box):
         scrolled.set_child(self.grid_view)
         self.append(scrolled)
 
-        # Register as observer for config changes
-        # Wrap callback to ensure it runs on main thread (GTK requirement)
-        self.config_manager.add_observer(lambda: GLib.idle_add(self.reload_cheatsheet))
+        # Reload on config changes (signal is emitted on the main thread)
+        ConfigChangeNotifier.for_manager(self.config_manager).connect(
+            "changed", lambda _notifier: self.reload_cheatsheet()
+        )
 
         # Load bindings
         self.reload_cheatsheet()
@@ -167,14 +165,14 @@ class CheatsheetTab(Gtk.Box):
 
     def reload_cheatsheet(self) -> None:
         """Reload cheatsheet from config (called by observer pattern)."""
-        self.list_store.remove_all()
+        items = []
 
-        if not self.config_manager.config:
-            return
+        if self.config_manager.config:
+            bindings = self.config_manager.config.get_all_bindings()
+            items = [BindingCardObject(binding) for binding in bindings]
 
-        bindings = self.config_manager.config.get_all_bindings()
-        for binding in bindings:
-            self.list_store.append(BindingCardObject(binding))
+        # Replace store contents with a single items-changed emission
+        self.list_store.splice(0, self.list_store.get_n_items(), items)
 
     def _on_export_pdf(self, button: Gtk.Button) -> None:
         """Handle PDF export."""
@@ -1,11 +1,6 @@
 """Community tab for importing configs from popular GitHub profiles."""
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Gio, GObject, Adw
+from hyprbind._gi_bootstrap import Gtk, Gio, GObject, Adw
 from typing import Dict, List, Any, Optional, Callable
 
 from hyprbind.integrations.github_fetcher import GitHubFetcher
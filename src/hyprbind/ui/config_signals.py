@@ -0,0 +1,62 @@
+"""GObject signal bridge for ConfigManager change notifications."""
+
+import threading
+import weakref
+
+from hyprbind._gi_bootstrap import GLib, GObject
+from hyprbind.core.config_manager import ConfigManager
+
+
+class ConfigChangeNotifier(GObject.Object):
+    """Re-emit ConfigManager observer notifications as a GObject "changed" signal.
+
+    ConfigManager stays free of GTK, so the UI registers one observer per
+    manager through this bridge instead of one lambda per widget. Bursts of
+    notifications (from any thread) are coalesced into a single idle callback
+    that emits "changed" on the main thread.
+
+    Example:
+        notifier = ConfigChangeNotifier.for_manager(config_manager)
+        notifier.connect("changed", lambda _notifier: self.reload())
+    """
+
+    __gtype_name__ = "HyprBindConfigChangeNotifier"
+    __gsignals__ = {"changed": (GObject.SignalFlags.RUN_LAST, None, ())}
+
+    _instances: "weakref.WeakKeyDictionary[ConfigManager, ConfigChangeNotifier]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, config_manager: ConfigManager) -> None:
+        """Initialize and register as observer on config_manager."""
+        super().__init__()
+        # Guards _emit_pending; observers may be notified from worker threads
+        self._emit_lock = threading.Lock()
+        self._emit_pending = False
+        config_manager.add_observer(self._on_config_changed)
+
+    @classmethod
+    def for_manager(cls, config_manager: ConfigManager) -> "ConfigChangeNotifier":
+        """Return the notifier for config_manager, creating it on first use."""
+        notifier = cls._instances.get(config_manager)
+        if notifier is None:
+            notifier = cls(config_manager)
+            cls._instances[config_manager] = notifier
+        return notifier
+
+    def _on_config_changed(self) -> None:
+        """Observer callback - may run on any thread."""
+        with self._emit_lock:
+            if self._emit_pending:
+                return
+            self._emit_pending = True
+        GLib.idle_add(self._emit_changed)
+
+    def _emit_changed(self) -> bool:
+        """Emit "changed" on the main thread."""
+        # Cleared before emitting, so a notification during the emission
+        # schedules another one instead of being dropped
+        with self._emit_lock:
+            self._emit_pending = False
+        self.emit("changed")
+        return False  # Don't call again
@@ -1,17 +1,13 @@
 """Editor tab for managing keybindings with category grouping."""
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Gio, GObject, Adw, GLib
+from hyprbind._gi_bootstrap import Gtk, Gio, GObject, Adw
 from typing import Optional
 
 from hyprbind.core.config_manager import ConfigManager
 from hyprbind.core.mode_manager import ModeManager
 from hyprbind.core.models import Binding
 from hyprbind.ui.binding_dialog import BindingDialog
+from hyprbind.ui.config_signals import ConfigChangeNotifier
 
 
 class BindingWithSection(GObject.Object):
@@ -78,9 +74,10 @@ class EditorTab(Gtk.Box):
         toolbar = self._create_toolbar()
         self.prepend(toolbar)
 
-        # Register as observer for config changes
-        # Wrap callback to ensure it runs on main thread (GTK requirement)
-        self.config_manager.add_observer(lambda: GLib.idle_add(self.reload_bindings))
+        # Reload on config changes (signal is emitted on the main thread)
+        ConfigChangeNotifier.for_manager(self.config_manager).connect(
+            "changed", lambda _notifier: self.reload_bindings()
+        )
 
         # Initial load
         self.reload_bindings()
@@ -234,27 +231,25 @@ class EditorTab(Gtk.Box):
 
     def reload_bindings(self) -> None:
         """Reload bindings from config (called by observer pattern)."""
-        self.list_store.remove_all()
+        items = []
 
-        if not self.config_manager.config:
-            return
+        if self.config_manager.config:
+            # Load with category headers
+            for category in sorted(self.config_manager.config.categories.keys()):
+                category_obj = self.config_manager.config.categories[category]
+                bindings = category_obj.bindings
 
-        # Load with category headers
-        for category in sorted(self.config_manager.config.categories.keys()):
-            category_obj = self.config_manager.config.categories[category]
-            bindings = category_obj.bindings
+                if not bindings:
+                    continue
 
-            if not bindings:
-                continue
+                # Add header
+                items.append(BindingWithSection(is_header=True, header_text=category))
 
-            # Add header
-            self.list_store.append(
-                BindingWithSection(is_header=True, header_text=category)
-            )
+                # Add bindings
+                items.extend(BindingWithSection(binding=binding) for binding in bindings)
 
-            # Add bindings
-            for binding in bindings:
-                self.list_store.append(BindingWithSection(binding=binding))
+        # Replace store contents with a single items-changed emission
+        self.list_store.splice(0, self.list_store.get_n_items(), items)
 
     def _on_add_clicked(self, button: Gtk.Button) -> None:
         """Handle Add button click - show dialog for new binding.
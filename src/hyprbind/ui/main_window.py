@@ -1,17 +1,15 @@
 """Main application window."""
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Adw, GLib
+from hyprbind._gi_bootstrap import Gtk, Adw, GLib
 from pathlib import Path
-from typing import Any, Optional
-import sys
+from typing import TYPE_CHECKING, Any, Optional
 import threading
 
 from hyprbind.core.logging_config import get_logger
+from hyprbind.ui.ui_files import get_ui_file_path
+
+if TYPE_CHECKING:
+    from hyprbind.theming import ColorPalette
 
 logger = get_logger(__name__)
 
@@ -23,38 +21,7 @@ def _get_ui_file_path() -> Path:
     Returns:
         Path to main_window.ui file
     """
-    # Try development path first (for running from git repo)
-    dev_path = Path(__file__).parent.parent.parent.parent / "data" / "ui" / "main_window.ui"
-    if dev_path.exists():
-        return dev_path
-
-    # Try installed package data path
-    try:
-        from importlib.resources import files
-        ui_file = files("hyprbind").parent / "data" / "ui" / "main_window.ui"
-        if ui_file.exists():
-            return ui_file
-    except (ImportError, AttributeError):
-        pass
-
-    # Fallback: check common installation locations
-    possible_paths = [
-        Path(sys.prefix) / "share" / "hyprbind" / "ui" / "main_window.ui",
-        Path.home() / ".local" / "share" / "hyprbind" / "ui" / "main_window.ui",
-    ]
-
-    for path in possible_paths:
-        if path.exists():
-            return path
-
-    # If all else fails, return dev path and let it fail with clear error
-    raise FileNotFoundError(
-        f"Could not find main_window.ui. Tried:\n"
-        f"  - Development: {dev_path}\n"
-        f"  - Package data: <importlib.resources>\n"
-        f"  - System: {possible_paths}\n"
-        f"Please ensure the package is properly installed or run from git repository."
-    )
+    return get_ui_file_path("main_window.ui")
 
 
 _UI_FILE = _get_ui_file_path()
@@ -70,8 +37,6 @@ class MainWindow(Adw.ApplicationWindow):
     __gtype_name__ = "HyprBindMainWindow"
 
     # Template children with type annotations
-    main_content: Gtk.Box = Gtk.Template.Child()
-    header_bar: Adw.HeaderBar = Gtk.Template.Child()
     chezmoi_banner: Adw.Banner = Gtk.Template.Child()
     live_mode_banner: Adw.Banner = Gtk.Template.Child()
     mode_switch: Gtk.Switch = Gtk.Template.Child()
@@ -84,6 +49,9 @@ class MainWindow(Adw.ApplicationWindow):
         """Initialize the main window."""
         super().__init__(**kwargs)
 
+        # Error dialog is created on first use and reused afterwards
+        self._error_dialog: Optional[Adw.MessageDialog] = None
+
         # Initialize ConfigManager
         from hyprbind.core.config_manager import ConfigManager
         self.config_manager = ConfigManager()
@@ -104,36 +72,74 @@ class MainWindow(Adw.ApplicationWindow):
         # Setup tabs
         self._setup_tabs()
 
-        # Register as observer for config changes
-        # Wrap callback to ensure it runs on main thread (GTK requirement)
-        self.config_manager.add_observer(lambda: GLib.idle_add(self._on_config_changed))
+        # Listen for config changes (signal is emitted on the main thread)
+        from hyprbind.ui.config_signals import ConfigChangeNotifier
+        ConfigChangeNotifier.for_manager(self.config_manager).connect(
+            "changed", lambda _notifier: self._on_config_changed()
+        )
 
         # Load config asynchronously
         self._load_config_async()
 
     def _setup_theming(self) -> None:
-        """Setup dynamic theming with Wallust colors if available."""
-        from hyprbind.theming import WallustLoader, ThemeManager
+        """Setup dynamic theming with Wallust colors if available.
+
+        The last known palette is applied from cache right away so the first
+        frame is already themed. Probing Wallust and parsing its output files
+        happens in a background thread once the main loop is idle.
+        """
+        from hyprbind.theming import ThemeManager
 
         # Initialize theme manager
         self.theme_manager = ThemeManager()
 
-        # Check if Wallust is installed
-        if not WallustLoader.is_installed():
-            logger.info("Wallust not installed, using default theme")
-            return
+        self._apply_cached_theme()
+        GLib.idle_add(self._refresh_theme_async)
 
-        # Try to load colors
-        palette = WallustLoader.load_colors()
-        if palette:
-            # Apply Wallust colors
-            success = self.theme_manager.apply_theme(palette)
-            if success:
-                logger.info("Applied Wallust dynamic colors")
+    def _apply_cached_theme(self) -> None:
+        """Apply the cached Wallust palette, if any (single file read)."""
+        from hyprbind.theming import WallustLoader
+
+        palette = WallustLoader.load_cached_colors()
+        if palette and self.theme_manager.apply_theme(palette):
+            logger.info("Applied cached Wallust colors")
+
+    def _refresh_theme_async(self) -> bool:
+        """Reload Wallust colors in background thread."""
+        from hyprbind.theming import WallustLoader
+
+        def refresh_thread():
+            """Background thread function."""
+            palette = None
+            if not WallustLoader.is_installed():
+                logger.info("Wallust not installed, using default theme")
             else:
-                logger.warning("Failed to apply Wallust colors, using default theme")
-        else:
+                palette = WallustLoader.load_colors()
+            GLib.idle_add(self._on_theme_refreshed, palette)
+
+        thread = threading.Thread(target=refresh_thread, daemon=True)
+        thread.start()
+        return False  # Don't call again
+
+    def _on_theme_refreshed(self, palette: Optional["ColorPalette"]) -> bool:
+        """Called on main thread with freshly loaded Wallust colors."""
+        from hyprbind.theming import WallustLoader
+
+        if palette is None:
             logger.info("No Wallust colors found, using default theme")
+            if self.theme_manager.current_palette is not None:
+                self.theme_manager.apply_theme(None)
+            return False
+
+        if palette == self.theme_manager.current_palette:
+            return False  # Cached colors are still current
+
+        if self.theme_manager.apply_theme(palette):
+            logger.info("Applied Wallust dynamic colors")
+            WallustLoader.save_cached_colors(palette)
+        else:
+            logger.warning("Failed to apply Wallust colors, using default theme")
+        return False  # Don't call again
 
     def _setup_chezmoi_banner(self) -> None:
         """Setup the Chezmoi banner and connect its signals."""
@@ -230,11 +236,16 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_loading(self) -> None:
         """Show loading indicator."""
-        self.loading_box.set_visible(True)
+        if not self.loading_box.get_visible():
+            self.loading_box.set_visible(True)
+            self.loading_spinner.start()
 
     def _hide_loading(self) -> None:
         """Hide loading indicator."""
-        self.loading_box.set_visible(False)
+        if self.loading_box.get_visible():
+            self.loading_box.set_visible(False)
+            # A spinning spinner keeps redrawing every frame even while hidden
+            self.loading_spinner.stop()
 
     def _load_config_async(self) -> None:
         """Load config in background thread."""
@@ -258,7 +269,6 @@ class MainWindow(Adw.ApplicationWindow):
         self._check_chezmoi_management()
         # Tabs will be notified via observer pattern
         # For now, they're just placeholders
-        return False  # Don't call again
 
     def _on_config_load_error(self, error_message: str) -> None:
         """Called on main thread if config loading fails."""
@@ -269,7 +279,6 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_body(f"Failed to load configuration:\n{error_message}")
         dialog.add_response("ok", "OK")
         dialog.present()
-        return False  # Don't call again
 
     def _on_config_changed(self) -> None:
         """Observer callback - called when config changes."""
@@ -315,11 +324,9 @@ class MainWindow(Adw.ApplicationWindow):
                 self.destroy()
             else:
                 # Show error
-                error_dialog = Adw.MessageDialog.new(self)
-                error_dialog.set_heading("Save Failed")
-                error_dialog.set_body(f"Failed to save configuration:\n{result.message}")
-                error_dialog.add_response("ok", "OK")
-                error_dialog.present()
+                self._show_error_dialog(
+                    "Save Failed", f"Failed to save configuration:\n{result.message}"
+                )
 
     def _on_mode_toggled(self, switch: Gtk.Switch, _: Any) -> None:
         """Handle mode toggle switch change."""
@@ -409,8 +416,12 @@ class MainWindow(Adw.ApplicationWindow):
             heading: Dialog heading
             message: Error message
         """
-        dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(heading)
-        dialog.set_body(message)
-        dialog.add_response("ok", "OK")
-        dialog.present()
+        if self._error_dialog is None:
+            self._error_dialog = Adw.MessageDialog.new(self)
+            self._error_dialog.add_response("ok", "OK")
+            # Hide instead of destroying on response so the dialog can be reused
+            self._error_dialog.set_hide_on_close(True)
+
+        self._error_dialog.set_heading(heading)
+        self._error_dialog.set_body(message)
+        self._error_dialog.present()
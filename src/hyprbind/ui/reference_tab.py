@@ -1,27 +1,63 @@
 """Reference tab for Hyprland keybinding documentation."""
 
-import gi
-gi.require_version("Gtk", "4.0")
+from dataclasses import dataclass
+from typing import Optional
 
-from gi.repository import Gtk, Gio, GObject
+from hyprbind._gi_bootstrap import Gtk
 
 from hyprbind.data.hyprland_reference import HYPRLAND_ACTIONS
+from hyprbind.ui.ui_files import get_ui_file_path
+
+# Delay before search-changed fires, so a burst of keystrokes filters once
+SEARCH_DEBOUNCE_MS = 120
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceAction:
+    """Immutable action record with its precomputed search string."""
+
+    name: str
+    description: str
+    example: str
+    category: str
+    search_key: str
+
+    @classmethod
+    def from_dict(cls, action: dict) -> "ReferenceAction":
+        """Create from a HYPRLAND_ACTIONS entry."""
+        return cls(
+            name=action["name"],
+            description=action["description"],
+            example=action["example"],
+            category=action["category"],
+            search_key=f"{action['name']}\n{action['description']}\n{action['category']}",
+        )
+
 
+# Reference data is static, so it is converted once and shared by all tabs
+REFERENCE_ACTIONS = tuple(ReferenceAction.from_dict(action) for action in HYPRLAND_ACTIONS)
+# Rows are bound by search string, which must therefore be unique per action
+_ACTIONS_BY_KEY = {action.search_key: action for action in REFERENCE_ACTIONS}
 
-class ActionObject(GObject.Object):
-    """Wrapper for action reference data."""
 
-    action: dict = GObject.Property(type=object)
+@Gtk.Template(filename=str(get_ui_file_path("reference_row.ui")))
+class ReferenceRow(Gtk.Box):
+    """List row showing a single action, built from a Builder template."""
 
-    def __init__(self, action: dict) -> None:
-        """Initialize with action dict."""
-        super().__init__()
-        self.action = action
+    __gtype_name__ = "HyprBindReferenceRow"
+
+    name_label: Gtk.Label = Gtk.Template.Child()
+    desc_label: Gtk.Label = Gtk.Template.Child()
+    example_label: Gtk.Label = Gtk.Template.Child()
+    category_label: Gtk.Label = Gtk.Template.Child()
 
 
 class ReferenceTab(Gtk.Box):
     """Tab for Hyprland keybinding reference."""
 
+    # Row factory shared by every instance (see _get_factory)
+    _factory: Optional[Gtk.SignalListItemFactory] = None
+
     def __init__(self) -> None:
         """Initialize reference tab."""
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
@@ -33,15 +69,22 @@ class ReferenceTab(Gtk.Box):
         search_entry.set_margin_end(12)
         search_entry.set_margin_top(12)
         search_entry.set_margin_bottom(6)
+        search_entry.set_search_delay(SEARCH_DEBOUNCE_MS)
         search_entry.connect("search-changed", self._on_search_changed)
         self.search_entry = search_entry
         self.append(search_entry)
 
-        # Create list store
-        self.list_store = Gio.ListStore.new(ActionObject)
+        # Create list store of search strings; full action dicts are looked up on bind
+        self.list_store = Gtk.StringList()
 
-        # Create filter model
-        self.filter = Gtk.CustomFilter.new(self._filter_func, None)
+        # Load actions before the filter model observes the store
+        self._load_actions()
+
+        # Create filter model (substring match runs in C, no Python callback per item)
+        expression = Gtk.PropertyExpression.new(Gtk.StringObject, None, "string")
+        self.filter = Gtk.StringFilter.new(expression)
+        self.filter.set_match_mode(Gtk.StringFilterMatchMode.SUBSTRING)
+        self.filter.set_ignore_case(True)
         self.filter_model = Gtk.FilterListModel.new(self.list_store, self.filter)
 
         # Create selection model
@@ -50,11 +93,8 @@ class ReferenceTab(Gtk.Box):
         # Create list view
         self.list_view = Gtk.ListView.new(self.selection_model, None)
 
-        # Create factory
-        factory = Gtk.SignalListItemFactory()
-        factory.connect("setup", self._on_factory_setup)
-        factory.connect("bind", self._on_factory_bind)
-        self.list_view.set_factory(factory)
+        # Rows don't depend on tab state, so the factory is shared
+        self.list_view.set_factory(type(self)._get_factory())
 
         # Add to scrolled window
         scrolled = Gtk.ScrolledWindow()
@@ -62,104 +102,39 @@ class ReferenceTab(Gtk.Box):
         scrolled.set_child(self.list_view)
         self.append(scrolled)
 
-        # Load actions
-        self._load_actions()
-
     def _load_actions(self) -> None:
-        """Load action reference data."""
-        for action in HYPRLAND_ACTIONS:
-            self.list_store.append(ActionObject(action))
+        """Load action reference data in a single items-changed emission."""
+        self.list_store.splice(0, 0, [action.search_key for action in REFERENCE_ACTIONS])
+
+    @classmethod
+    def _get_factory(cls) -> Gtk.SignalListItemFactory:
+        """Return the row factory, creating it on first use."""
+        if cls._factory is None:
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", cls._on_factory_setup)
+            factory.connect("bind", cls._on_factory_bind)
+            cls._factory = factory
+        return cls._factory
+
+    @staticmethod
+    def _on_factory_setup(factory: Gtk.SignalListItemFactory,
+                          list_item: Gtk.ListItem) -> None:
+        """Setup list item widget."""
+        list_item.set_child(ReferenceRow())
 
-    def _on_factory_setup(self, factory: Gtk.SignalListItemFactory,
+    @staticmethod
+    def _on_factory_bind(factory: Gtk.SignalListItemFactory,
                          list_item: Gtk.ListItem) -> None:
-        """Setup list item widget."""
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
-
-        # Action name
-        name_label = Gtk.Label()
-        name_label.set_name("name_label")
-        name_label.set_xalign(0)
-        name_label.add_css_class("heading")
-        box.append(name_label)
-
-        # Description
-        desc_label = Gtk.Label()
-        desc_label.set_name("desc_label")
-        desc_label.set_xalign(0)
-        desc_label.set_wrap(True)
-        box.append(desc_label)
-
-        # Example
-        example_label = Gtk.Label()
-        example_label.set_name("example_label")
-        example_label.set_xalign(0)
-        example_label.add_css_class("dim-label")
-        example_label.add_css_class("monospace")
-        box.append(example_label)
-
-        # Category (optional, small label)
-        category_label = Gtk.Label()
-        category_label.set_name("category_label")
-        category_label.set_xalign(0)
-        category_label.add_css_class("caption")
-        category_label.add_css_class("dim-label")
-        box.append(category_label)
-
-        list_item.set_child(box)
-
-    def _on_factory_bind(self, factory: Gtk.SignalListItemFactory,
-                        list_item: Gtk.ListItem) -> None:
         """Bind action data to list item."""
-        action_obj = list_item.get_item()
-        action = action_obj.action
-
-        box = list_item.get_child()
-
-        # Find labels
-        name_label = None
-        desc_label = None
-        example_label = None
-        category_label = None
-
-        child = box.get_first_child()
-        while child:
-            if child.get_name() == "name_label":
-                name_label = child
-            elif child.get_name() == "desc_label":
-                desc_label = child
-            elif child.get_name() == "example_label":
-                example_label = child
-            elif child.get_name() == "category_label":
-                category_label = child
-            child = child.get_next_sibling()
-
-        # Set text
-        if name_label:
-            name_label.set_text(action["name"])
-        if desc_label:
-            desc_label.set_text(action["description"])
-        if example_label:
-            example_label.set_text(f"Example: {action['example']}")
-        if category_label:
-            category_label.set_text(f"Category: {action['category']}")
-
-    def _filter_func(self, item: ActionObject, user_data) -> bool:
-        """Filter function for search."""
-        search_text = self.search_entry.get_text().lower()
-        if not search_text:
-            return True
-
-        action = item.action
-        return (
-            search_text in action["name"].lower()
-            or search_text in action["description"].lower()
-            or search_text in action["category"].lower()
-        )
+        action = _ACTIONS_BY_KEY[list_item.get_item().get_string()]
+
+        row = list_item.get_child()
+
+        row.name_label.set_text(action.name)
+        row.desc_label.set_text(action.description)
+        row.example_label.set_text(f"Example: {action.example}")
+        row.category_label.set_text(f"Category: {action.category}")
 
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
         """Handle search text change."""
-        self.filter.changed(Gtk.FilterChange.DIFFERENT)
+        self.filter.set_search(entry.get_text())
@@ -0,0 +1,71 @@
+"""Locate GTK Builder UI files in development and installed layouts."""
+
+from functools import lru_cache
+from pathlib import Path
+import os
+import sys
+
+# Development UI directory (for running from git repo), computed once at import
+_DEV_UI_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "data", "ui")
+)
+
+
+@lru_cache(maxsize=None)
+def get_ui_file_path(filename: str) -> Path:
+    """
+    Get path to a UI file, works both in development and when installed.
+
+    The lookup is cached, so the filesystem is probed at most once per file.
+    Candidates are checked with ``os.path.isfile`` (a single ``stat()`` each) in order:
+    the ``HYPRBIND_UI_DIR`` environment variable, installed package data, the
+    development tree, and finally common installation prefixes.
+
+    Args:
+        filename: Name of the file inside ``data/ui`` (e.g. ``main_window.ui``)
+
+    Returns:
+        Path to the UI file
+
+    Raises:
+        FileNotFoundError: If the file cannot be found in any location
+    """
+    # Explicit override, e.g. for packagers or tests
+    ui_dir = os.environ.get("HYPRBIND_UI_DIR")
+    if ui_dir:
+        env_path = os.path.join(ui_dir, filename)
+        if os.path.isfile(env_path):
+            return Path(env_path)
+
+    # Try installed package data path
+    try:
+        from importlib.resources import files
+        ui_file = files("hyprbind").parent / "data" / "ui" / filename
+        if ui_file.is_file():
+            return Path(str(ui_file))
+    except (ImportError, AttributeError, TypeError):
+        pass
+
+    # Try development path (for running from git repo)
+    dev_path = os.path.join(_DEV_UI_DIR, filename)
+    if os.path.isfile(dev_path):
+        return Path(dev_path)
+
+    # Fallback: check common installation locations
+    possible_paths = [
+        os.path.join(sys.prefix, "share", "hyprbind", "ui", filename),
+        os.path.join(os.path.expanduser("~"), ".local", "share", "hyprbind", "ui", filename),
+    ]
+
+    for path in possible_paths:
+        if os.path.isfile(path):
+            return Path(path)
+
+    raise FileNotFoundError(
+        f"Could not find {filename}. Tried:\n"
+        f"  - Environment: HYPRBIND_UI_DIR={ui_dir or '<unset>'}\n"
+        f"  - Package data: <importlib.resources>\n"
+        f"  - Development: {dev_path}\n"
+        f"  - System: {possible_paths}\n"
+        f"Please ensure the package is properly installed or run from git repository."
+    )
@@ -1,11 +1,7 @@
 #!/usr/bin/env python3
 """Visual test for dynamic theme system."""
 
-import gi
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-
-from gi.repository import Gtk, Adw
+from hyprbind._gi_bootstrap import Gtk, Adw
 from hyprbind.theming import WallustLoader, ThemeManager, ColorPalette
 
 
@@ -1,15 +1,11 @@
 """Shared test fixtures for HyprBind tests."""
 
-import pytest
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
+import itertools
+from datetime import datetime, timedelta
 
-from gi.repository import Gtk, Adw
-from unittest.mock import MagicMock
-from pathlib import Path
+import pytest
 
+from hyprbind.core.backup_manager import BACKUP_DIR_ENV
 from hyprbind.core.config_manager import ConfigManager, OperationResult
 from hyprbind.core.mode_manager import ModeManager
 from hyprbind.core.models import Config, Category
@@ -21,6 +17,8 @@ def config_manager(tmp_path):
 
     CRITICAL: Uses tmp_path to ensure tests NEVER write to user's real config.
     """
+    from unittest.mock import MagicMock  # only fixture that needs mock
+
     # Create temp config file
     temp_config = tmp_path / "test_keybinds.conf"
     temp_config.write_text("# Test config - isolated from real user config\n")
@@ -37,6 +35,30 @@ def config_manager(tmp_path):
     return manager
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_backups(tmp_path_factory):
+    """Point default BackupManagers at a directory owned by this session.
+
+    Keeps tests off the real ~/.config backups and safe under pytest -n,
+    where each worker runs its own session. Tests that count backups pass
+    their own backup_dir.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(BACKUP_DIR_ENV, str(tmp_path_factory.mktemp("wk_backups")))
+        yield
+
+
+@pytest.fixture
+def fake_clock():
+    """Clock for BackupManager that advances one second per call.
+
+    Gives backups distinct, ordered timestamps without sleeping.
+    """
+    start = datetime(2024, 1, 1)
+    ticks = itertools.count()
+    return lambda: start + timedelta(seconds=next(ticks))
+
+
 @pytest.fixture
 def mode_manager(config_manager):
     """Create ModeManager for testing."""
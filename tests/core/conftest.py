@@ -0,0 +1,89 @@
+"""Shared fixtures for core tests."""
+
+import copy
+import hashlib
+import os
+from pathlib import Path
+import pickle
+
+import pytest
+
+import hyprbind.core.models
+import hyprbind.parsers
+from hyprbind.core.config_manager import ConfigManager
+from tests.support.fake_backup import FakeBackupManager
+from tests.support.fake_hyprland import FakeHyprlandClientClass
+
+
+@pytest.fixture(autouse=True)
+def _frozen_backup_clock(monkeypatch, fake_clock):
+    """Give every BackupManager built in core tests a deterministic clock."""
+    monkeypatch.setattr("hyprbind.core.backup_manager._now", fake_clock)
+
+
+@pytest.fixture(scope="class")
+def _hyprland_client_class():
+    """Install one FakeHyprlandClientClass for a whole test class."""
+    fake = FakeHyprlandClientClass()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("hyprbind.ipc.hyprland_client.HyprlandClient", fake)
+        yield fake
+
+
+@pytest.fixture
+def patched_hyprland_client(_hyprland_client_class):
+    """Class-wide fake HyprlandClient, reset to a clean state for each test."""
+    _hyprland_client_class.reset()
+    return _hyprland_client_class
+
+
+@pytest.fixture(scope="session")
+def sample_config_path():
+    """Path to sample keybinds config."""
+    return Path(__file__).parent.parent / "fixtures" / "sample_keybinds.conf"
+
+
+def _parse_cache_key(config_path: Path) -> str:
+    """Key a parsed config on its file and on the parser and model sources."""
+    sources = [config_path, Path(hyprbind.core.models.__file__)]
+    sources += sorted(Path(hyprbind.parsers.__file__).parent.glob("*.py"))
+    stamp = "|".join(
+        f"{path}:{path.stat().st_mtime_ns}:{path.stat().st_size}" for path in sources
+    )
+    return hashlib.blake2b(stamp.encode(), digest_size=16).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def _loaded_config(request, sample_config_path):
+    """Sample config parsed once per session; never mutate directly.
+
+    The parse result is pickled under .pytest_cache so later runs skip the
+    parser until the sample file or the parser changes.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:  # cacheprovider plugin disabled
+        return ConfigManager(sample_config_path, skip_validation=True).load()
+
+    cache_file = cache.mkdir("hyprbind-parse") / f"{_parse_cache_key(sample_config_path)}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # Missing or unreadable entry; parse and rewrite it
+
+    config = ConfigManager(sample_config_path, skip_validation=True).load()
+    # Per-process temp name, so xdist workers never write the same file
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp_file, "wb") as f:
+        pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return config
+
+
+@pytest.fixture
+def manager(sample_config_path, _loaded_config):
+    """ConfigManager with its own copy of the loaded sample config."""
+    mgr = ConfigManager(sample_config_path, skip_validation=True)
+    mgr.config = copy.deepcopy(_loaded_config)
+    mgr.backup_manager = FakeBackupManager()
+    return mgr
@@ -1,22 +1,63 @@
 """Tests for BackupManager - timestamped backup system."""
 
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime
-import time
 import tempfile
 import shutil
 
-from hyprbind.core.backup_manager import BackupManager, BackupInfo
+from hyprbind.core.backup_manager import BACKUP_DIR_ENV, BackupManager, BackupInfo
+
+
+SOURCE_CONTENT = "bind = SUPER, A, exec, app"
+
+
+@pytest.fixture(scope="session")
+def source_config(tmp_path_factory):
+    """Config file written once per session and linked into tests."""
+    path = tmp_path_factory.mktemp("source") / "keybinds.conf"
+    path.write_text(SOURCE_CONTENT)
+    return path
+
+
+@pytest.fixture
+def link_config(source_config):
+    """Return a helper that hardlinks the shared source config to a path.
+
+    Tests that modify the linked file must unlink it first, otherwise the
+    shared source changes too.
+    """
+    def _link(dest: Path) -> Path:
+        try:
+            os.link(source_config, dest)
+        except OSError:
+            shutil.copyfile(source_config, dest)
+        return dest
+
+    return _link
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """Temporary directory shared by all tests of a class."""
+    return tmp_path_factory.mktemp("bm")
+
+
+@pytest.fixture
+def class_tmp_path(class_tmp, request):
+    """Per-test subdirectory of the class directory, named after the test."""
+    path = class_tmp / request.node.name
+    path.mkdir()
+    return path
 
 
 class TestBackupCreation:
     """Test backup file creation with timestamps."""
 
-    def test_create_backup_generates_timestamped_file(self, tmp_path):
+    def test_create_backup_generates_timestamped_file(self, tmp_path, link_config):
         """Backup filename includes ISO timestamp."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
+        config_file = link_config(tmp_path / "keybinds.conf")
 
         manager = BackupManager(backup_dir=tmp_path / "backups")
         backup_path = manager.create_backup(config_file, skip_validation=True)
@@ -24,22 +65,23 @@ class TestBackupCreation:
         # Check backup exists
         assert backup_path.exists()
 
-        # Check filename format: keybinds.conf.2025-11-13T14-30-00.backup
+        # Check filename format: keybinds.conf.2025-11-13T14-30-00-123456.backup
         assert backup_path.stem.startswith("keybinds.conf.")
         assert backup_path.suffix == ".backup"
 
         # Extract timestamp portion
         name_parts = backup_path.stem.split(".")
-        assert len(name_parts) == 3  # ['keybinds', 'conf', '2025-11-13T14-30-00']
+        assert len(name_parts) == 3  # ['keybinds', 'conf', '2025-11-13T14-30-00-123456']
         timestamp_str = name_parts[2]
 
         # Verify timestamp format (ISO 8601 compatible)
-        assert len(timestamp_str) == 19  # YYYY-MM-DDTHH-MM-SS
+        assert len(timestamp_str) == 26  # YYYY-MM-DDTHH-MM-SS-ffffff
         assert timestamp_str[4] == "-"
         assert timestamp_str[7] == "-"
         assert timestamp_str[10] == "T"
         assert timestamp_str[13] == "-"
         assert timestamp_str[16] == "-"
+        assert timestamp_str[19] == "-"
 
     def test_create_backup_preserves_content(self, tmp_path):
         """Backup contains exact copy of original file."""
@@ -52,10 +94,67 @@ class TestBackupCreation:
 
         assert backup_path.read_text() == original_content
 
-    def test_create_backup_creates_backup_dir_if_missing(self, tmp_path):
-        """Backup directory is created automatically."""
+    def test_create_backup_preserves_source_mode(self, tmp_path):
+        """A private config gets a private backup, not a world-readable one."""
+        config_file = tmp_path / "keybinds.conf"
+        config_file.write_text(SOURCE_CONTENT)
+        config_file.chmod(0o600)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+
+        assert backup_path.stat().st_mode & 0o777 == 0o600
+
+    def test_create_backup_copies_large_binary_file(self, tmp_path):
+        """Backup copies files larger than a single copy chunk byte-for-byte."""
+        config_file = tmp_path / "keybinds.conf"
+        original_bytes = bytes(range(256)) * 8192  # 2 MiB
+        config_file.write_bytes(original_bytes)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+
+        assert backup_path.read_bytes() == original_bytes
+
+    def test_create_backup_falls_back_when_copy_file_range_unsupported(
+        self, tmp_path, monkeypatch
+    ):
+        """Cross-device copy_file_range errors fall back to another copy path."""
+        import errno
+
+        def refuse(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+
+        # Larger than the small-file buffer, so the in-kernel paths are used
         config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
+        original_bytes = b"bind = SUPER, A, exec, app\n" * 4096
+        config_file.write_bytes(original_bytes)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+
+        assert backup_path.read_bytes() == original_bytes
+
+    def test_create_backup_small_file_fast_path(self, tmp_path, link_config, monkeypatch):
+        """Small configs are copied without copy_file_range or sendfile."""
+        def unexpected(*args, **kwargs):
+            raise AssertionError("small files should use the buffered path")
+
+        monkeypatch.setattr(os, "copy_file_range", unexpected, raising=False)
+        monkeypatch.setattr(os, "sendfile", unexpected, raising=False)
+
+        config_file = link_config(tmp_path / "keybinds.conf")
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+
+        assert backup_path.read_text() == SOURCE_CONTENT
+
+    def test_create_backup_creates_backup_dir_if_missing(self, tmp_path, link_config):
+        """Backup directory is created automatically."""
+        config_file = link_config(tmp_path / "keybinds.conf")
 
         backup_dir = tmp_path / "nested" / "backups"
         assert not backup_dir.exists()
@@ -74,46 +173,64 @@ class TestBackupCreation:
         with pytest.raises(FileNotFoundError):
             manager.create_backup(tmp_path / "nonexistent.conf", skip_validation=True)
 
-    def test_multiple_backups_have_different_timestamps(self, tmp_path):
+    def test_multiple_backups_have_different_timestamps(self, tmp_path, link_config, fake_clock):
         """Sequential backups get different timestamps."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
+        config_file = link_config(tmp_path / "keybinds.conf")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=tmp_path / "backups", clock=fake_clock)
 
         backup1 = manager.create_backup(config_file, skip_validation=True)
-        time.sleep(1.1)  # Ensure different second
         backup2 = manager.create_backup(config_file, skip_validation=True)
 
         assert backup1 != backup2
         assert backup1.exists()
         assert backup2.exists()
 
+    def test_create_backups_batch_returns_paths_in_input_order(self, tmp_path):
+        """Batch backup copies every file and preserves input order."""
+        configs = []
+        for i in range(4):
+            config_file = tmp_path / f"config{i}.conf"
+            config_file.write_text(f"content {i}")
+            configs.append(config_file)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_paths = manager.create_backups_batch(configs, skip_validation=True)
+
+        assert len(backup_paths) == 4
+        for i, backup_path in enumerate(backup_paths):
+            assert backup_path.name.startswith(f"config{i}.conf.")
+            assert backup_path.read_text() == f"content {i}"
+
+    def test_create_backups_batch_empty_list(self, tmp_path):
+        """Empty batch creates nothing."""
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+
+        assert manager.create_backups_batch([], skip_validation=True) == []
+
 
 class TestListBackups:
     """Test listing available backups for a config file."""
 
-    def test_list_backups_returns_empty_for_no_backups(self, tmp_path):
+    def test_list_backups_returns_empty_for_no_backups(self, class_tmp_path):
         """No backups returns empty list."""
-        config_file = tmp_path / "keybinds.conf"
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        config_file = class_tmp_path / "keybinds.conf"
+        manager = BackupManager(backup_dir=class_tmp_path / "backups")
 
         backups = manager.list_backups(config_file)
 
         assert backups == []
 
-    def test_list_backups_finds_timestamped_backups(self, tmp_path):
+    def test_list_backups_finds_timestamped_backups(self, class_tmp_path, fake_clock):
         """List finds all backups for a config file."""
-        config_file = tmp_path / "keybinds.conf"
+        config_file = class_tmp_path / "keybinds.conf"
         config_file.write_text("original")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups", clock=fake_clock)
 
         # Create 3 backups
         backup1 = manager.create_backup(config_file, skip_validation=True)
-        time.sleep(1.1)
         backup2 = manager.create_backup(config_file, skip_validation=True)
-        time.sleep(1.1)
         backup3 = manager.create_backup(config_file, skip_validation=True)
 
         backups = manager.list_backups(config_file)
@@ -124,13 +241,13 @@ class TestListBackups:
         assert backups[1].path == backup2
         assert backups[2].path == backup1
 
-    def test_list_backups_includes_metadata(self, tmp_path):
+    def test_list_backups_includes_metadata(self, class_tmp_path):
         """Backup info includes timestamp, size, and path."""
-        config_file = tmp_path / "keybinds.conf"
+        config_file = class_tmp_path / "keybinds.conf"
         content = "bind = SUPER, A, exec, app"
         config_file.write_text(content)
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups")
         backup_path = manager.create_backup(config_file, skip_validation=True)
 
         backups = manager.list_backups(config_file)
@@ -144,14 +261,14 @@ class TestListBackups:
         assert isinstance(backup_info.timestamp, datetime)
         assert backup_info.original_name == "keybinds.conf"
 
-    def test_list_backups_only_returns_matching_file(self, tmp_path):
+    def test_list_backups_only_returns_matching_file(self, class_tmp_path):
         """List only returns backups for the specific config file."""
-        config1 = tmp_path / "keybinds.conf"
-        config2 = tmp_path / "monitors.conf"
+        config1 = class_tmp_path / "keybinds.conf"
+        config2 = class_tmp_path / "monitors.conf"
         config1.write_text("bind1")
         config2.write_text("monitor1")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups")
 
         backup1 = manager.create_backup(config1, skip_validation=True)
         backup2 = manager.create_backup(config2, skip_validation=True)
@@ -164,12 +281,12 @@ class TestListBackups:
         assert keybind_backups[0].path == backup1
         assert monitor_backups[0].path == backup2
 
-    def test_list_backups_ignores_non_backup_files(self, tmp_path):
+    def test_list_backups_ignores_non_backup_files(self, class_tmp_path):
         """List ignores files without .backup extension."""
-        config_file = tmp_path / "keybinds.conf"
+        config_file = class_tmp_path / "keybinds.conf"
         config_file.write_text("bind")
 
-        backup_dir = tmp_path / "backups"
+        backup_dir = class_tmp_path / "backups"
         backup_dir.mkdir()
 
         manager = BackupManager(backup_dir=backup_dir)
@@ -187,25 +304,50 @@ class TestListBackups:
         assert len(backups) == 1
         assert backups[0].path == real_backup
 
+    def test_list_backups_parses_filename_timestamp(self, class_tmp_path):
+        """Timestamps come from the filename; impossible dates are skipped."""
+        backup_dir = class_tmp_path / "backups"
+        backup_dir.mkdir()
+        (backup_dir / "keybinds.conf.2025-11-13T14-30-05-000042.backup").write_text("ok")
+        (backup_dir / "keybinds.conf.2025-13-40T14-30-05-000000.backup").write_text("bad")
+
+        manager = BackupManager(backup_dir=backup_dir)
+        backups = manager.list_backups(class_tmp_path / "keybinds.conf")
+
+        assert len(backups) == 1
+        assert backups[0].timestamp == datetime(2025, 11, 13, 14, 30, 5, 42)
+
+    def test_list_backups_reads_legacy_second_resolution_names(self, class_tmp_path):
+        """Backups named before microsecond timestamps are still listed."""
+        backup_dir = class_tmp_path / "backups"
+        backup_dir.mkdir()
+        (backup_dir / "keybinds.conf.2025-11-13T14-30-05.backup").write_text("old")
+
+        manager = BackupManager(backup_dir=backup_dir)
+        backups = manager.list_backups(class_tmp_path / "keybinds.conf")
+
+        assert len(backups) == 1
+        assert backups[0].timestamp == datetime(2025, 11, 13, 14, 30, 5)
+
 
 class TestRestoreBackup:
     """Test restoring from backup."""
 
-    def test_restore_backup_replaces_target_file(self, tmp_path):
+    def test_restore_backup_replaces_target_file(self, tmp_path, link_config):
         """Restore overwrites target with backup content."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("original content")
+        config_file = link_config(tmp_path / "keybinds.conf")
 
         manager = BackupManager(backup_dir=tmp_path / "backups")
         backup_path = manager.create_backup(config_file, skip_validation=True)
 
-        # Modify original
+        # Modify original (break the hardlink first)
+        config_file.unlink()
         config_file.write_text("modified content")
 
         # Restore
         manager.restore_backup(backup_path, config_file, skip_validation=True)
 
-        assert config_file.read_text() == "original content"
+        assert config_file.read_text() == SOURCE_CONTENT
 
     def test_restore_backup_creates_target_if_missing(self, tmp_path):
         """Restore creates target file if it doesn't exist."""
@@ -252,23 +394,67 @@ class TestRestoreBackup:
         assert new_location.exists()
         assert new_location.read_text() == "content"
 
+    def test_restore_backup_swaps_in_complete_file(self, tmp_path, monkeypatch):
+        """Restore writes a temp file and renames it over the target."""
+        config_file = tmp_path / "keybinds.conf"
+        config_file.write_text("original content")
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+        config_file.write_text("modified content")
+
+        replaced = []
+        real_replace = os.replace
+
+        def recording_replace(src, dst):
+            # Target still holds its old content right up to the rename
+            replaced.append((Path(src).read_text(), Path(dst).read_text()))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", recording_replace)
+        manager.restore_backup(backup_path, config_file, skip_validation=True)
+
+        assert replaced == [("original content", "modified content")]
+        assert config_file.read_text() == "original content"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["backups", "keybinds.conf"]
+
+    def test_restore_backup_writes_through_symlinked_target(self, tmp_path):
+        """A symlinked config stays a symlink and keeps its own mode."""
+        dotfiles = tmp_path / "dotfiles"
+        dotfiles.mkdir()
+        real_file = dotfiles / "keybinds.conf"
+        real_file.write_text("original content")
+        config_file = tmp_path / "keybinds.conf"
+        config_file.symlink_to(real_file)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = manager.create_backup(config_file, skip_validation=True)
+        backup_path.chmod(0o644)
+        real_file.write_text("modified content")
+        real_file.chmod(0o600)
+
+        manager.restore_backup(backup_path, config_file, skip_validation=True)
+
+        assert config_file.is_symlink()
+        assert real_file.read_text() == "original content"
+        assert real_file.stat().st_mode & 0o777 == 0o600
+        assert sorted(p.name for p in dotfiles.iterdir()) == ["keybinds.conf"]
+
 
 class TestCleanupOldBackups:
     """Test automatic cleanup of old backups."""
 
-    def test_cleanup_keeps_n_most_recent_backups(self, tmp_path):
+    def test_cleanup_keeps_n_most_recent_backups(self, class_tmp_path, link_config, fake_clock):
         """Cleanup retains only the N newest backups."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("content")
+        config_file = link_config(class_tmp_path / "keybinds.conf")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups", clock=fake_clock)
 
         # Create 5 backups
         backups = []
         for i in range(5):
             backup = manager.create_backup(config_file, skip_validation=True)
             backups.append(backup)
-            time.sleep(1.1)
 
         # Keep only 3 most recent
         deleted_count = manager.cleanup_old_backups(config_file, keep=3)
@@ -286,16 +472,16 @@ class TestCleanupOldBackups:
         assert not backups[1].exists()  # deleted
         assert not backups[0].exists()  # deleted
 
-    def test_cleanup_with_fewer_backups_than_keep_limit(self, tmp_path):
+    def test_cleanup_with_fewer_backups_than_keep_limit(
+        self, class_tmp_path, link_config, fake_clock
+    ):
         """Cleanup does nothing if backups < keep limit."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("content")
+        config_file = link_config(class_tmp_path / "keybinds.conf")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups", clock=fake_clock)
 
         # Create only 2 backups
         backup1 = manager.create_backup(config_file, skip_validation=True)
-        time.sleep(1.1)
         backup2 = manager.create_backup(config_file, skip_validation=True)
 
         # Try to keep 5
@@ -305,32 +491,76 @@ class TestCleanupOldBackups:
         assert backup1.exists()
         assert backup2.exists()
 
-    def test_cleanup_with_no_backups(self, tmp_path):
+    def test_cleanup_orders_legacy_and_microsecond_names(self, class_tmp_path):
+        """Cleanup orders backups by timestamp across both filename formats."""
+        backup_dir = class_tmp_path / "backups"
+        backup_dir.mkdir()
+        older = backup_dir / "keybinds.conf.2025-11-13T14-30-05-999999.backup"
+        newer = backup_dir / "keybinds.conf.2025-11-13T14-30-06.backup"
+        other = backup_dir / "keybinds.conf.bak.2025-11-13T14-30-00.backup"
+        for path in (older, newer, other):
+            path.write_text("content")
+
+        manager = BackupManager(backup_dir=backup_dir)
+        deleted = manager.cleanup_old_backups(class_tmp_path / "keybinds.conf", keep=1)
+
+        assert deleted == 1
+        assert newer.exists()
+        assert not older.exists()
+        assert other.exists()
+
+    def test_cleanup_does_not_parse_timestamps(self, class_tmp_path, monkeypatch):
+        """Cleanup orders by filename fields without building datetimes."""
+        from hyprbind.core import backup_manager as backup_manager_module
+
+        backup_dir = class_tmp_path / "backups"
+        backup_dir.mkdir()
+        for second in range(3):
+            (backup_dir / f"keybinds.conf.2025-11-13T14-30-0{second}-000000.backup").write_text("x")
+
+        class NoParse:
+            @staticmethod
+            def fromisoformat(value):
+                raise AssertionError("cleanup should not parse timestamps")
+
+        manager = BackupManager(backup_dir=backup_dir)
+        monkeypatch.setattr(backup_manager_module, "datetime", NoParse)
+
+        deleted = manager.cleanup_old_backups(class_tmp_path / "keybinds.conf", keep=1)
+
+        assert deleted == 2
+        assert [p.name for p in backup_dir.iterdir()] == [
+            "keybinds.conf.2025-11-13T14-30-02-000000.backup"
+        ]
+
+    def test_cleanup_with_no_backups(self, class_tmp_path):
         """Cleanup handles no backups gracefully."""
-        config_file = tmp_path / "keybinds.conf"
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        config_file = class_tmp_path / "keybinds.conf"
+        manager = BackupManager(backup_dir=class_tmp_path / "backups")
 
         deleted_count = manager.cleanup_old_backups(config_file, keep=5)
 
         assert deleted_count == 0
 
-    def test_cleanup_only_affects_specified_config(self, tmp_path):
+    def test_cleanup_only_affects_specified_config(self, class_tmp_path, fake_clock):
         """Cleanup only removes backups for the specified file."""
-        config1 = tmp_path / "keybinds.conf"
-        config2 = tmp_path / "monitors.conf"
+        config1 = class_tmp_path / "keybinds.conf"
+        config2 = class_tmp_path / "monitors.conf"
         config1.write_text("bind1")
         config2.write_text("monitor1")
 
-        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager = BackupManager(backup_dir=class_tmp_path / "backups", clock=fake_clock)
 
         # Create multiple backups for both configs
         keybind_backups = []
         monitor_backups = []
 
         for i in range(5):
-            keybind_backups.append(manager.create_backup(config1, skip_validation=True))
-            monitor_backups.append(manager.create_backup(config2, skip_validation=True))
-            time.sleep(1.1)
+            keybind_backup, monitor_backup = manager.create_backups_batch(
+                [config1, config2], skip_validation=True
+            )
+            keybind_backups.append(keybind_backup)
+            monitor_backups.append(monitor_backup)
 
         # Cleanup only keybinds, keep 2
         deleted = manager.cleanup_old_backups(config1, keep=2)
@@ -346,11 +576,88 @@ class TestCleanupOldBackups:
         assert len(remaining_monitors) == 5
 
 
+class TestBackupIndex:
+    """Test the in-memory index of backup files."""
+
+    def test_list_backups_scans_directory_once(self, tmp_path, link_config, monkeypatch):
+        """Repeated listings reuse the index instead of rescanning."""
+        import os
+
+        config_file = link_config(tmp_path / "keybinds.conf")
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager.create_backup(config_file, skip_validation=True)
+
+        scans = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        manager.list_backups(config_file)
+        manager.list_backups(config_file)
+        manager.cleanup_old_backups(config_file, keep=1)
+
+        assert len(scans) == 1
+
+    def test_missing_backup_dir_seen_once_created_elsewhere(self, tmp_path, link_config):
+        """A cached miss ends when another manager creates the directory."""
+        config_file = link_config(tmp_path / "keybinds.conf")
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+
+        assert manager.list_backups(config_file) == []
+        assert manager.cleanup_old_backups(config_file, keep=1) == 0
+
+        other = BackupManager(backup_dir=tmp_path / "backups")
+        backup_path = other.create_backup(config_file, skip_validation=True)
+
+        assert [b.path for b in manager.list_backups(config_file)] == [backup_path]
+
+    def test_index_tracks_new_and_deleted_backups(self, tmp_path, link_config, fake_clock):
+        """Backups created or cleaned up after indexing are reflected."""
+        config_file = link_config(tmp_path / "keybinds.conf")
+
+        manager = BackupManager(backup_dir=tmp_path / "backups", clock=fake_clock)
+        first = manager.create_backup(config_file, skip_validation=True)
+        assert [b.path for b in manager.list_backups(config_file)] == [first]
+        second = manager.create_backup(config_file, skip_validation=True)
+        assert [b.path for b in manager.list_backups(config_file)] == [second, first]
+
+        manager.cleanup_old_backups(config_file, keep=1)
+        assert [b.path for b in manager.list_backups(config_file)] == [second]
+
+    def test_index_sees_changes_made_by_another_manager(
+        self, tmp_path, link_config, fake_clock
+    ):
+        """Backups added or removed through a second manager are picked up."""
+        config_file = link_config(tmp_path / "keybinds.conf")
+
+        manager = BackupManager(backup_dir=tmp_path / "backups", clock=fake_clock)
+        first = manager.create_backup(config_file, skip_validation=True)
+        assert [b.path for b in manager.list_backups(config_file)] == [first]
+
+        other = BackupManager(backup_dir=tmp_path / "backups", clock=fake_clock)
+        second = other.create_backup(config_file, skip_validation=True)
+        assert [b.path for b in manager.list_backups(config_file)] == [second, first]
+
+        other.cleanup_old_backups(config_file, keep=1)
+        assert [b.path for b in manager.list_backups(config_file)] == [second]
+
+        third = other.create_backup(config_file, skip_validation=True)
+        fourth = manager.create_backup(config_file, skip_validation=True)
+        assert [b.path for b in manager.list_backups(config_file)] == [fourth, third, second]
+
+
 class TestBackupManagerDefaultBehavior:
     """Test default BackupManager configuration."""
 
-    def test_default_backup_dir_is_config_dir(self, tmp_path):
+    def test_default_backup_dir_is_config_dir(self, tmp_path, monkeypatch):
         """Default backup directory is in same dir as config."""
+        monkeypatch.delenv(BACKUP_DIR_ENV)
+
         # Create manager without backup_dir
         manager = BackupManager()
 
@@ -358,9 +665,40 @@ class TestBackupManagerDefaultBehavior:
         expected = Path.home() / ".config" / "hypr" / "config" / ".backups"
         assert manager.backup_dir == expected
 
+    def test_env_overrides_default_backup_dir(self, tmp_path, monkeypatch):
+        """HYPRBIND_BACKUP_DIR replaces the default directory."""
+        monkeypatch.setenv(BACKUP_DIR_ENV, str(tmp_path / "env_backups"))
+
+        assert BackupManager().backup_dir == tmp_path / "env_backups"
+
     def test_custom_backup_dir_is_used(self, tmp_path):
         """Custom backup directory is respected."""
         custom_dir = tmp_path / "my_backups"
         manager = BackupManager(backup_dir=custom_dir)
 
         assert manager.backup_dir == custom_dir
+
+    def test_default_fsync_policy_syncs_directory_once_per_batch(
+        self, tmp_path, link_config, monkeypatch
+    ):
+        """Default policy flushes the directory, not each backup file."""
+        from hyprbind.core import backup_manager as backup_manager_module
+
+        synced = []
+        monkeypatch.setattr(
+            backup_manager_module,
+            "_fsync_path",
+            lambda path, directory=False: synced.append((path, directory)),
+        )
+        configs = [link_config(tmp_path / "keybinds.conf"), link_config(tmp_path / "other.conf")]
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+
+        assert manager.fsync == "dir"
+        manager.create_backups_batch(configs, skip_validation=True)
+
+        assert synced == [(tmp_path / "backups", True)]
+
+    def test_invalid_fsync_policy_rejected(self, tmp_path):
+        """Unknown fsync policies raise ValueError."""
+        with pytest.raises(ValueError):
+            BackupManager(backup_dir=tmp_path / "backups", fsync="always")
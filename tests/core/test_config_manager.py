@@ -2,24 +2,10 @@
 
 from pathlib import Path
 
-import pytest
-
 from hyprbind.core.config_manager import ConfigManager, OperationResult
 from hyprbind.core.models import Binding, BindType
 
 
-@pytest.fixture
-def sample_config_path():
-    """Path to sample keybinds config."""
-    return Path(__file__).parent.parent / "fixtures" / "sample_keybinds.conf"
-
-
-@pytest.fixture
-def manager(sample_config_path):
-    """ConfigManager instance with sample config."""
-    return ConfigManager(sample_config_path, skip_validation=True)
-
-
 class TestLoadConfig:
     """Test config loading."""
 
@@ -38,8 +24,6 @@ class TestAddBinding:
 
     def test_add_binding_no_conflict(self, manager):
         """Add binding successfully when no conflict."""
-        manager.load()
-
         new_binding = Binding(
             type=BindType.BINDD,
             modifiers=["$mainMod"],
@@ -61,8 +45,6 @@ class TestAddBinding:
 
     def test_add_binding_with_conflict(self, manager):
         """Add conflicting binding returns error with conflicts list."""
-        manager.load()
-
         # Create binding that conflicts with existing one ($mainMod + Q)
         conflicting_binding = Binding(
             type=BindType.BINDD,
@@ -89,8 +71,6 @@ class TestRemoveBinding:
 
     def test_remove_binding(self, manager):
         """Remove existing binding."""
-        manager.load()
-
         # Get an existing binding
         bindings = manager.config.get_all_bindings()
         binding_to_remove = bindings[0]
@@ -103,8 +83,6 @@ class TestRemoveBinding:
 
     def test_remove_nonexistent_binding(self, manager):
         """Remove non-existent binding fails."""
-        manager.load()
-
         fake_binding = Binding(
             type=BindType.BINDD,
             modifiers=["$mainMod"],
@@ -128,8 +106,6 @@ class TestUpdateBinding:
 
     def test_update_binding(self, manager):
         """Update existing binding."""
-        manager.load()
-
         # Get an existing binding
         old_binding = manager.config.get_all_bindings()[0]
 
@@ -155,8 +131,6 @@ class TestUpdateBinding:
 
     def test_update_binding_with_conflict(self, manager):
         """Update binding fails if new binding conflicts."""
-        manager.load()
-
         bindings = manager.config.get_all_bindings()
         old_binding = bindings[0]
         conflicting_binding = bindings[1]
@@ -182,6 +156,33 @@ class TestUpdateBinding:
         # Old binding should still be there (rollback)
         assert old_binding in manager.config.get_all_bindings()
 
+    def test_update_binding_rollback_restores_order_silently(self, manager):
+        """A rolled-back update keeps binding order and notifies nobody."""
+        original_order = list(manager.config.get_all_bindings())
+        old_binding, conflicting_binding = original_order[0], original_order[1]
+        notified = []
+        manager.add_observer(lambda: notified.append(True))
+
+        new_binding = Binding(
+            type=old_binding.type,
+            modifiers=conflicting_binding.modifiers,
+            key=conflicting_binding.key,
+            description="New description",
+            action=old_binding.action,
+            params=old_binding.params,
+            submap=conflicting_binding.submap,
+            line_number=old_binding.line_number,
+            category=old_binding.category,
+        )
+
+        result = manager.update_binding(old_binding, new_binding)
+
+        assert result.success is False
+        assert manager.config.get_all_bindings() == original_order
+        assert manager.config.find_conflict(old_binding) is old_binding
+        assert notified == []
+        assert manager.is_dirty() is False
+
 
 class TestConfigNotLoaded:
     """Test operations fail if config not loaded."""
@@ -277,8 +278,6 @@ class TestBindingIndexMaintenance:
 
     def test_remove_then_add_same_key_combo(self, manager):
         """After removing binding, same key combo can be re-added (index updated)."""
-        manager.load()
-
         # Get an existing binding
         bindings = manager.config.get_all_bindings()
         original_binding = bindings[0]
@@ -308,8 +307,6 @@ class TestBindingIndexMaintenance:
 
     def test_update_binding_maintains_index(self, manager):
         """Update binding properly updates index for conflict detection."""
-        manager.load()
-
         bindings = manager.config.get_all_bindings()
         old_binding = bindings[0]
 
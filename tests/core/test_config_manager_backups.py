@@ -1,27 +1,38 @@
 """Tests for ConfigManager backup integration."""
 
-import pytest
+from datetime import datetime
+import os
 from pathlib import Path
-import time
 
+import pytest
+
+from hyprbind.core.backup_manager import BACKUP_DIR_ENV, BackupInfo, BackupManager
 from hyprbind.core.config_manager import ConfigManager
-from hyprbind.core.models import Binding, BindType
+from hyprbind.core.models import Binding, BindType, Category, Config
+from tests.support.seed import SEED, write_seed
+
+
+@pytest.fixture
+def isolated_manager(request, tmp_path, fake_clock):
+    """Loaded ConfigManager whose backups go to an isolated directory.
+
+    The config content defaults to a single binding; override it with
+    indirect parametrization.
+    """
+    config_file = write_seed(tmp_path, getattr(request, "param", SEED))
+
+    manager = ConfigManager(config_path=config_file, skip_validation=True)
+    manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups", clock=fake_clock)
+    manager.load()
+    return manager
 
 
 class TestConfigManagerBackupIntegration:
     """Test automatic backup creation and management via ConfigManager."""
 
-    def test_save_creates_timestamped_backup(self, tmp_path):
+    def test_save_creates_timestamped_backup(self, isolated_manager):
         """Saving config creates timestamped backup automatically."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
+        manager = isolated_manager
 
         # Save should create backup
         result = manager.save()
@@ -36,15 +47,9 @@ class TestConfigManagerBackupIntegration:
         config_file = tmp_path / "keybinds.conf"
 
         manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
         manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
 
-        manager.config = manager.load() if config_file.exists() else None
-
         # Create minimal config
-        from hyprbind.core.models import Config, Category
-
         manager.config = Config(categories={"Test": Category(name="Test", bindings=[])})
 
         # Save to new file (doesn't exist yet)
@@ -55,25 +60,15 @@ class TestConfigManagerBackupIntegration:
         backups = manager.list_backups()
         assert len(backups) == 0
 
-    def test_multiple_saves_create_multiple_backups(self, tmp_path):
+    def test_multiple_saves_create_multiple_backups(self, isolated_manager):
         """Multiple saves create multiple timestamped backups."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
+        manager = isolated_manager
 
         # First save
         manager.save()
-        time.sleep(1.1)
 
         # Second save
         manager.save()
-        time.sleep(1.1)
 
         # Third save
         manager.save()
@@ -85,65 +80,54 @@ class TestConfigManagerBackupIntegration:
         timestamps = [b.timestamp for b in backups]
         assert len(timestamps) == len(set(timestamps))
 
-    def test_old_backups_cleaned_up_automatically(self, tmp_path):
-        """Old backups are automatically cleaned up, keeping last 5."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
+    def test_save_prunes_backups_to_keep_count(self, isolated_manager, monkeypatch):
+        """Each save prunes old backups itself, keeping the newest ones."""
+        monkeypatch.setattr("hyprbind.core.config_manager.BACKUP_KEEP_COUNT", 2)
+        manager = isolated_manager
 
-        manager.load()
+        for _ in range(3):
+            manager.save()
 
-        # Create 7 backups
+        backups = manager.list_backups()
+        assert len(backups) == 2
+        assert backups[0].timestamp > backups[1].timestamp
+
+    def test_old_backups_cleaned_up_to_keep_count(self, isolated_manager, tmp_path):
+        """Cleanup keeps the 5 newest backups (seeded directly, no saves)."""
+        manager = isolated_manager
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
         for i in range(7):
-            manager.save()
-            time.sleep(1.1)
+            (backup_dir / f"keybinds.conf.2024-01-01T00-00-0{i}.backup").write_bytes(b"x")
+
+        manager.backup_manager.cleanup_old_backups(manager.config_path, keep=5)
 
-        # Should only have 5 backups (last 5 kept)
         backups = manager.list_backups()
         assert len(backups) == 5
+        assert [b.timestamp.second for b in backups] == [6, 5, 4, 3, 2]
 
-    def test_list_backups_returns_sorted_newest_first(self, tmp_path):
+    def test_list_backups_returns_sorted_newest_first(self, isolated_manager, tmp_path):
         """Backup list is sorted with newest first."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
+        manager = isolated_manager
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
 
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
-
-        # Create 3 backups
-        for i in range(3):
-            manager.save()
-            time.sleep(1.1)
+        # Seed backups out of order
+        stamps = [datetime(2024, 1, 1, 0, 0, s) for s in (3, 1, 2)]
+        for ts in stamps:
+            (backup_dir / f"keybinds.conf.{ts:%Y-%m-%dT%H-%M-%S}.backup").write_text("x")
 
         backups = manager.list_backups()
 
-        # Verify sorted newest first
-        for i in range(len(backups) - 1):
-            assert backups[i].timestamp > backups[i + 1].timestamp
+        assert [b.timestamp for b in backups] == sorted(stamps, reverse=True)
 
 
 class TestConfigManagerBackupRestore:
     """Test backup restore functionality."""
 
-    def test_restore_from_backup(self, tmp_path):
+    def test_restore_from_backup(self, isolated_manager):
         """Can restore config from backup."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
+        manager = isolated_manager
 
         # Save to create backup
         original_bindings_count = len(manager.config.get_all_bindings())
@@ -168,7 +152,6 @@ class TestConfigManagerBackupRestore:
         )
         manager.add_binding(new_binding)
         manager.save()
-        time.sleep(1.1)
 
         # Config should now have more bindings
         assert len(manager.config.get_all_bindings()) > original_bindings_count
@@ -182,17 +165,13 @@ class TestConfigManagerBackupRestore:
         # Config should be back to original state
         assert len(manager.config.get_all_bindings()) == original_bindings_count
 
-    def test_restore_reloads_config(self, tmp_path):
+    @pytest.mark.parametrize(
+        "isolated_manager", ["bind = SUPER, A, exec, original"], indirect=True
+    )
+    def test_restore_reloads_config(self, isolated_manager):
         """Restore automatically reloads config from restored file."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, original")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
+        manager = isolated_manager
+        config_file = manager.config_path
         manager.save()
 
         backups = manager.list_backups()
@@ -213,25 +192,14 @@ class TestConfigManagerBackupRestore:
         first_binding = manager.config.get_all_bindings()[0]
         assert first_binding.params == "original"
 
-    def test_restore_nonexistent_backup_fails(self, tmp_path):
+    def test_restore_nonexistent_backup_fails(self, isolated_manager):
         """Restoring non-existent backup returns error."""
-        config_file = tmp_path / "keybinds.conf"
-        config_file.write_text("bind = SUPER, A, exec, app")
-
-        manager = ConfigManager(config_path=config_file, skip_validation=True)
-        # Use isolated backup directory for this test
-        from hyprbind.core.backup_manager import BackupManager
-        manager.backup_manager = BackupManager(backup_dir=tmp_path / "backups")
-
-        manager.load()
+        manager = isolated_manager
 
         # Create fake backup info
-        from hyprbind.core.backup_manager import BackupInfo
-        from datetime import datetime
-
         fake_backup = BackupInfo(
-            path=tmp_path / "nonexistent.backup",
-            timestamp=datetime.now(),
+            path=manager.config_path.parent / "nonexistent.backup",
+            timestamp=datetime(2024, 1, 1),
             size=100,
             original_name="keybinds.conf",
         )
@@ -252,9 +220,34 @@ class TestBackupManagerInstance:
         assert hasattr(manager, "backup_manager")
         assert manager.backup_manager is not None
 
-    def test_backup_manager_uses_default_backup_dir(self, tmp_path):
+    def test_backup_manager_uses_default_backup_dir(self, tmp_path, monkeypatch):
         """BackupManager uses default .backups directory."""
+        monkeypatch.delenv(BACKUP_DIR_ENV)
         manager = ConfigManager(config_path=tmp_path / "keybinds.conf", skip_validation=True)
 
         expected_dir = Path.home() / ".config" / "hypr" / "config" / ".backups"
         assert manager.backup_manager.backup_dir == expected_dir
+
+    def test_backup_manager_access_does_no_file_io(self, tmp_path, monkeypatch):
+        """Constructing ConfigManager and its BackupManager never touches disk."""
+        def unexpected_io(*args, **kwargs):
+            pytest.fail("unexpected file IO")
+
+        monkeypatch.setattr(Path, "stat", unexpected_io)
+        monkeypatch.setattr(Path, "exists", unexpected_io)
+        monkeypatch.setattr(Path, "open", unexpected_io)
+
+        manager = ConfigManager(config_path=tmp_path / "keybinds.conf", skip_validation=True)
+
+        assert manager.config is None
+        assert manager.backup_manager.backup_dir == Path(os.environ[BACKUP_DIR_ENV])
+
+    def test_default_backup_manager_created_lazily(self, tmp_path):
+        """Default BackupManager is only built when first needed."""
+        manager = ConfigManager(config_path=tmp_path / "keybinds.conf", skip_validation=True)
+        assert manager._backup_manager is None
+
+        backup_manager = manager.backup_manager
+
+        assert isinstance(backup_manager, BackupManager)
+        assert manager.backup_manager is backup_manager
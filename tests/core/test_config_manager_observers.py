@@ -1,25 +1,27 @@
 """Tests for ConfigManager observer pattern and dirty tracking."""
 
-from pathlib import Path
+import dataclasses
 
-import pytest
-
-from hyprbind.core.config_manager import ConfigManager
 from hyprbind.core.models import Binding, BindType
 
 
-@pytest.fixture
-def sample_config_path():
-    """Path to sample keybinds config."""
-    return Path(__file__).parent.parent / "fixtures" / "sample_keybinds.conf"
+_TEMPLATE = Binding(
+    type=BindType.BINDD,
+    modifiers=["$mainMod"],
+    key="F1",
+    description="Test",
+    action="exec",
+    params="test",
+    submap=None,
+    line_number=0,
+    category="Test",
+)
 
 
-@pytest.fixture
-def manager(sample_config_path):
-    """ConfigManager with loaded config."""
-    mgr = ConfigManager(sample_config_path, skip_validation=True)
-    mgr.load()
-    return mgr
+def make_binding(**overrides) -> Binding:
+    """Binding based on _TEMPLATE with the given fields replaced."""
+    overrides.setdefault("modifiers", list(_TEMPLATE.modifiers))
+    return dataclasses.replace(_TEMPLATE, **overrides)
 
 
 class TestObserverPattern:
@@ -44,17 +46,7 @@ class TestObserverPattern:
 
         manager.add_observer(observer)
 
-        new_binding = Binding(
-            type=BindType.BINDD,
-            modifiers=["$mainMod"],
-            key="F1",
-            description="Test",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
-        )
+        new_binding = make_binding()
 
         manager.add_binding(new_binding)
         assert len(called) == 1
@@ -87,17 +79,7 @@ class TestObserverPattern:
         old_binding = manager.config.get_all_bindings()[0]
 
         # Create updated version
-        new_binding = Binding(
-            type=old_binding.type,
-            modifiers=old_binding.modifiers,
-            key="F2",  # Different key
-            description=old_binding.description,
-            action=old_binding.action,
-            params=old_binding.params,
-            submap=old_binding.submap,
-            line_number=old_binding.line_number,
-            category=old_binding.category,
-        )
+        new_binding = dataclasses.replace(old_binding, key="F2")
 
         manager.update_binding(old_binding, new_binding)
         assert len(called) >= 1  # Called at least once (may be called twice due to remove+add)
@@ -113,16 +95,10 @@ class TestObserverPattern:
 
         # Try to add conflicting binding (should fail)
         existing = manager.config.get_all_bindings()[0]
-        conflicting = Binding(
-            type=BindType.BINDD,
+        conflicting = make_binding(
             modifiers=existing.modifiers,
             key=existing.key,  # Same key/mods = conflict
             description="Conflict",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
         )
 
         result = manager.add_binding(conflicting)
@@ -143,17 +119,7 @@ class TestObserverPattern:
         manager.add_observer(observer1)
         manager.add_observer(observer2)
 
-        new_binding = Binding(
-            type=BindType.BINDD,
-            modifiers=["$mainMod"],
-            key="F1",
-            description="Test",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
-        )
+        new_binding = make_binding()
 
         manager.add_binding(new_binding)
         assert len(called1) == 1
@@ -169,17 +135,7 @@ class TestObserverPattern:
         manager.add_observer(observer)
         manager.remove_observer(observer)
 
-        new_binding = Binding(
-            type=BindType.BINDD,
-            modifiers=["$mainMod"],
-            key="F1",
-            description="Test",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
-        )
+        new_binding = make_binding()
 
         manager.add_binding(new_binding)
         assert len(called) == 0  # Observer was removed
@@ -197,17 +153,7 @@ class TestObserverPattern:
         manager.add_observer(bad_observer)
         manager.add_observer(good_observer)
 
-        new_binding = Binding(
-            type=BindType.BINDD,
-            modifiers=["$mainMod"],
-            key="F1",
-            description="Test",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
-        )
+        new_binding = make_binding()
 
         manager.add_binding(new_binding)
         assert len(called) == 1  # Good observer still called
@@ -222,17 +168,7 @@ class TestDirtyTracking:
 
     def test_dirty_after_add(self, manager):
         """Config is dirty after adding binding."""
-        new_binding = Binding(
-            type=BindType.BINDD,
-            modifiers=["$mainMod"],
-            key="F1",
-            description="Test",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
-        )
+        new_binding = make_binding()
 
         manager.add_binding(new_binding)
         assert manager.is_dirty()
@@ -246,17 +182,7 @@ class TestDirtyTracking:
     def test_dirty_after_update(self, manager):
         """Config is dirty after updating binding."""
         old_binding = manager.config.get_all_bindings()[0]
-        new_binding = Binding(
-            type=old_binding.type,
-            modifiers=old_binding.modifiers,
-            key="F2",
-            description=old_binding.description,
-            action=old_binding.action,
-            params=old_binding.params,
-            submap=old_binding.submap,
-            line_number=old_binding.line_number,
-            category=old_binding.category,
-        )
+        new_binding = dataclasses.replace(old_binding, key="F2")
 
         manager.update_binding(old_binding, new_binding)
         assert manager.is_dirty()
@@ -265,16 +191,10 @@ class TestDirtyTracking:
         """Config is NOT dirty after failed operation."""
         # Try to add conflicting binding
         existing = manager.config.get_all_bindings()[0]
-        conflicting = Binding(
-            type=BindType.BINDD,
+        conflicting = make_binding(
             modifiers=existing.modifiers,
             key=existing.key,
             description="Conflict",
-            action="exec",
-            params="test",
-            submap=None,
-            line_number=0,
-            category="Test",
         )
 
         result = manager.add_binding(conflicting)
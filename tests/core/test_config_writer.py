@@ -1,14 +1,12 @@
 import pytest
-from pathlib import Path
-import tempfile
 
 from hyprbind.core.config_writer import ConfigWriter
 from hyprbind.core.models import Config, Binding, BindType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config():
-    """Config with regular bindings and submap bindings."""
+    """Config with regular bindings and submap bindings (read-only)."""
     config = Config(file_path="test.conf", original_content="")
 
     # Regular binding
@@ -65,108 +63,94 @@ def sample_config():
     return config
 
 
-def test_write_config_with_submaps(sample_config):
-    """Write config with proper submap blocks."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.conf') as f:
-        output_path = Path(f.name)
+@pytest.fixture(scope="module")
+def sample_config_text(sample_config):
+    """Generated file content for sample_config, built once per module."""
+    return "\n".join(ConfigWriter.generate_content(sample_config))
 
-    try:
-        ConfigWriter.write_file(sample_config, output_path, skip_validation=True)
 
-        content = output_path.read_text()
+def test_write_config_with_submaps(sample_config_text):
+    """Write config with proper submap blocks."""
+    content = sample_config_text
 
-        # Should have category sections
-        assert "# ======= Window Actions =======" in content
-        assert "# ======= Modes =======" in content
+    # Should have category sections
+    assert "# ======= Window Actions =======" in content
+    assert "# ======= Modes =======" in content
 
-        # Should have submap block
-        assert "# ======= Submaps =======" in content
-        assert "submap = resize" in content
-        assert "submap = reset" in content
+    # Should have submap block
+    assert "# ======= Submaps =======" in content
+    assert "submap = resize" in content
+    assert "submap = reset" in content
 
-        # Submap bindings should be between submap markers
-        lines = content.split('\n')
-        submap_start = None
-        submap_end = None
+    # Submap bindings should be between submap markers
+    lines = content.split('\n')
+    submap_start = None
+    submap_end = None
 
-        for i, line in enumerate(lines):
-            if "submap = resize" in line:
-                submap_start = i
-            if submap_start is not None and "submap = reset" in line:
-                submap_end = i
-                break
+    for i, line in enumerate(lines):
+        if "submap = resize" in line:
+            submap_start = i
+        if submap_start is not None and "submap = reset" in line:
+            submap_end = i
+            break
 
-        assert submap_start is not None
-        assert submap_end is not None
-        assert submap_end > submap_start
+    assert submap_start is not None
+    assert submap_end is not None
+    assert submap_end > submap_start
 
-        # Check binding is in submap
-        submap_content = "\n".join(lines[submap_start:submap_end+1])
-        assert "resizeactive" in submap_content
+    # Check binding is in submap
+    submap_content = "\n".join(lines[submap_start:submap_end+1])
+    assert "resizeactive" in submap_content
 
-    finally:
-        output_path.unlink()
-        backup = output_path.with_suffix(output_path.suffix + '.backup')
-        if backup.exists():
-            backup.unlink()
 
+def test_write_file_writes_generated_content(sample_config, sample_config_text, tmp_path):
+    """write_file puts exactly the generated content on disk."""
+    output_path = tmp_path / "test.conf"
 
-def test_write_creates_backup():
-    """Backup is created before overwriting."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.conf') as f:
-        output_path = Path(f.name)
-        f.write("original content")
+    ConfigWriter.write_file(sample_config, output_path, skip_validation=True)
 
-    try:
-        config = Config(file_path=str(output_path), original_content="")
-        ConfigWriter.write_file(config, output_path, skip_validation=True)
+    assert output_path.read_text() == sample_config_text
 
-        backup_path = output_path.with_suffix(output_path.suffix + '.backup')
-        assert backup_path.exists()
 
-        backup_content = backup_path.read_text()
-        assert "original content" in backup_content
+def test_write_creates_backup(tmp_path):
+    """Backup is created before overwriting."""
+    output_path = tmp_path / "test.conf"
+    output_path.write_text("original content")
 
-    finally:
-        output_path.unlink()
-        backup = output_path.with_suffix(output_path.suffix + '.backup')
-        if backup.exists():
-            backup.unlink()
+    config = Config(file_path=str(output_path), original_content="")
+    ConfigWriter.write_file(config, output_path, skip_validation=True)
 
+    backup_path = output_path.with_suffix(output_path.suffix + '.backup')
+    assert backup_path.exists()
 
-def test_atomic_write_on_failure():
-    """Failed write cleans up temp files on error."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "test.conf"
-        output_path.write_text("original content")
+    backup_content = backup_path.read_text()
+    assert "original content" in backup_content
 
-        # Create invalid config that will fail during content generation
-        # We'll monkey-patch generate_content to raise an error
-        config = Config(file_path=str(output_path), original_content="")
 
-        original_generate = ConfigWriter.generate_content
+def test_atomic_write_on_failure(tmp_path, monkeypatch):
+    """Failed write cleans up temp files on error."""
+    output_path = tmp_path / "test.conf"
+    output_path.write_text("original content")
 
-        def failing_generate(cfg):
-            raise ValueError("Test error during generation")
+    # Make content generation fail; monkeypatch restores it even if asserts fail
+    config = Config(file_path=str(output_path), original_content="")
 
-        ConfigWriter.generate_content = failing_generate
+    def failing_generate(cfg):
+        raise ValueError("Test error during generation")
 
-        try:
-            with pytest.raises(IOError) as exc_info:
-                ConfigWriter.write_file(config, output_path, skip_validation=True)
+    monkeypatch.setattr(ConfigWriter, "generate_content", failing_generate)
 
-            # Should mention the error
-            assert "Failed to write config" in str(exc_info.value)
+    with pytest.raises(IOError) as exc_info:
+        ConfigWriter.write_file(config, output_path, skip_validation=True)
 
-            # No temp files should remain
-            temp_files = list(Path(tmpdir).glob(".hyprbind_tmp_*"))
-            assert len(temp_files) == 0, f"Temp files not cleaned up: {temp_files}"
+    # Should mention the error
+    assert "Failed to write config" in str(exc_info.value)
 
-            # Original file should still exist with original content
-            assert output_path.exists()
-            content = output_path.read_text()
-            assert "original content" in content
+    # No temp files should remain
+    temp_files = list(tmp_path.glob(".hyprbind_tmp_*"))
+    assert len(temp_files) == 0, f"Temp files not cleaned up: {temp_files}"
 
-        finally:
-            # Restore original method
-            ConfigWriter.generate_content = original_generate
+    # Original file should still exist with original content
+    assert output_path.exists()
+    content = output_path.read_text()
+    assert "original content" in content
@@ -305,13 +305,11 @@ def test_conflict_same_submap():
     assert conflicts[0] == binding1
 
 
-def test_conflict_detector_performance_with_many_bindings():
-    """Test ConflictDetector performs well with many bindings (uses O(1) index)."""
-    config = Config()
-
-    # Add 100 bindings with different keys
-    for i in range(100):
-        binding = Binding(
+@pytest.fixture(scope="module")
+def big_config():
+    """Config with 100 bindings ($mainMod + F0..F99); read-only."""
+    return Config.from_bindings([
+        Binding(
             type=BindType.BIND,
             modifiers=["$mainMod"],
             key=f"F{i}",
@@ -322,58 +320,127 @@ def test_conflict_detector_performance_with_many_bindings():
             line_number=i,
             category="Test",
         )
-        config.add_binding(binding)
-
-    # Check for conflict with the 50th binding
+        for i in range(100)
+    ])
+
+
+@pytest.mark.parametrize(
+    ("modifiers", "expected_keys"),
+    [
+        (["$mainMod"], ["F50"]),  # Conflicts with binding 50
+        (["$mainMod", "SHIFT"], []),  # Different modifiers
+    ],
+    ids=["conflict", "no-conflict"],
+)
+def test_conflict_detector_with_many_bindings(big_config, modifiers, expected_keys):
+    """ConflictDetector answers from the O(1) index with many bindings."""
     new_binding = Binding(
         type=BindType.BIND,
-        modifiers=["$mainMod"],
-        key="F50",  # Conflicts with binding 50
+        modifiers=modifiers,
+        key="F50",
         description="",
         action="exec",
-        params="conflict",
+        params="new",
         submap=None,
         line_number=101,
         category="Test",
     )
 
-    # Should find conflict efficiently using O(1) index lookup
-    conflicts = ConflictDetector.check(new_binding, config)
-    assert len(conflicts) == 1
-    assert conflicts[0].key == "F50"
+    conflicts = ConflictDetector.check(new_binding, big_config)
+    assert [c.key for c in conflicts] == expected_keys
 
 
-def test_conflict_detector_no_conflict_with_many_bindings():
-    """Test ConflictDetector returns empty list efficiently with many bindings."""
+def test_conflict_check_does_not_scan_bindings(monkeypatch):
+    """ConflictDetector answers from the chord index, never a linear scan."""
     config = Config()
+    existing = Binding(
+        type=BindType.BIND,
+        modifiers=["SHIFT", "$mainMod"],
+        key="Q",
+        description="",
+        action="killactive",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+    config.add_binding(existing)
 
-    # Add 100 bindings
-    for i in range(100):
-        binding = Binding(
-            type=BindType.BIND,
-            modifiers=["$mainMod"],
-            key=f"F{i}",
-            description="",
-            action="exec",
-            params=f"action{i}",
-            submap=None,
-            line_number=i,
-            category="Test",
-        )
-        config.add_binding(binding)
+    def no_scan():
+        raise AssertionError("conflict check must not walk all bindings")
+
+    monkeypatch.setattr(config, "get_all_bindings", no_scan)
 
-    # Check for non-conflicting binding
     new_binding = Binding(
         type=BindType.BIND,
-        modifiers=["$mainMod", "SHIFT"],  # Different modifiers
-        key="F50",
+        modifiers=["$mainMod", "SHIFT"],
+        key="Q",
         description="",
         action="exec",
-        params="no-conflict",
+        params="app",
         submap=None,
-        line_number=101,
-        category="Test",
+        line_number=2,
+        category="Window",
     )
 
-    conflicts = ConflictDetector.check(new_binding, config)
-    assert len(conflicts) == 0
+    assert ConflictDetector.check(new_binding, config) == (existing,)
+    assert ConflictDetector.has_conflicts(new_binding, config)
+
+
+def test_conflict_check_does_not_recanonicalize_modifiers(monkeypatch):
+    """Modifier order is normalized once per Binding, not on every check."""
+    from hyprbind.core import models
+
+    config = Config()
+    existing = Binding(
+        type=BindType.BIND,
+        modifiers=["SHIFT", "$mainMod"],
+        key="Q",
+        description="",
+        action="killactive",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+    config.add_binding(existing)
+    new_binding = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod", "SHIFT"],
+        key="Q",
+        description="",
+        action="exec",
+        params="app",
+        submap=None,
+        line_number=2,
+        category="Window",
+    )
+
+    def no_sort(*args, **kwargs):
+        raise AssertionError("conflict check must reuse the precomputed key")
+
+    monkeypatch.setattr(models, "sorted", no_sort, raising=False)
+
+    assert ConflictDetector.check(new_binding, config) == (existing,)
+
+
+def test_conflict_check_miss_returns_shared_empty_tuple():
+    """The no-conflict result is one shared immutable empty tuple."""
+    config = Config()
+    binding = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod"],
+        key="Q",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+
+    first = ConflictDetector.check(binding, config)
+    second = ConflictDetector.check(binding, config)
+
+    assert first == ()
+    assert first is second
@@ -30,6 +30,11 @@ class TestConstants:
         assert "ALT" in VALID_MODIFIERS
         assert "CTRL" in VALID_MODIFIERS
 
+    def test_valid_modifiers_is_uppercase_frozenset(self):
+        """Membership is a hash lookup against pre-uppercased names."""
+        assert isinstance(VALID_MODIFIERS, frozenset)
+        assert all(mod == mod.upper() for mod in VALID_MODIFIERS)
+
 
 class TestIsValidModifier:
     """Test is_valid_modifier function."""
@@ -55,10 +60,32 @@ class TestIsValidModifier:
         assert is_valid_modifier("") is False
         assert is_valid_modifier("SUPERKEY") is False
 
+    def test_builtin_check_skips_variable_check(self, monkeypatch):
+        """Builtin names never reach the variable name check."""
+        from hyprbind.core import constants
+
+        def no_match(value):
+            raise AssertionError("variable check used for a builtin modifier")
+
+        monkeypatch.setattr(constants, "_is_variable_name", no_match)
+
+        assert is_valid_modifier("SUPER") is True
+        assert is_valid_modifier("INVALID") is False
+
     def test_partial_variable_not_valid(self):
         assert is_valid_modifier("$") is False
+        assert is_valid_modifier("$mainMod\n") is False
         assert is_valid_modifier("mainMod") is False  # Missing $
 
+    def test_variable_check_agrees_with_pattern(self):
+        """The regex-free variable check accepts exactly what the pattern does."""
+        samples = [
+            "$", "$_", "$a", "$1", "$mainMod", "$main_mod", "$main-mod",
+            "$$double", "$mainMod\n", "$ spaced", "$mödMod", "$٣",
+        ]
+        for sample in samples:
+            assert is_valid_modifier(sample) is bool(VARIABLE_PATTERN.match(sample)), sample
+
 
 class TestVariablePattern:
     """Test VARIABLE_PATTERN regex."""
@@ -74,3 +101,4 @@ class TestVariablePattern:
         assert not VARIABLE_PATTERN.match("$")  # Empty name
         assert not VARIABLE_PATTERN.match("$main-mod")  # Hyphen not allowed
         assert not VARIABLE_PATTERN.match("$$double")  # Double $
+        assert not VARIABLE_PATTERN.match("$mainMod\n")  # Trailing newline
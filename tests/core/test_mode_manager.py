@@ -1,38 +1,73 @@
 """Tests for mode manager (Safe/Live toggle)."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from typing import List
 
 from hyprbind.core.mode_manager import ModeManager, Mode
-from hyprbind.core.config_manager import ConfigManager, OperationResult
+from hyprbind.core.config_manager import OperationResult
 from hyprbind.core.models import Binding, BindType
+from tests.support.fake_hyprland import FakeHyprlandClient
+
+
+class _StubConfigManager:
+    """Records Safe-mode calls and returns configurable results."""
+
+    def __init__(self) -> None:
+        """Succeed on every operation until told otherwise."""
+        self.add_result = OperationResult(success=True)
+        self.remove_result = OperationResult(success=True)
+        self.add_calls: List[Binding] = []
+        self.remove_calls: List[Binding] = []
+
+    def add_binding(self, binding: Binding) -> OperationResult:
+        """Record the add and return add_result."""
+        self.add_calls.append(binding)
+        return self.add_result
+
+    def remove_binding(self, binding: Binding) -> OperationResult:
+        """Record the remove and return remove_result."""
+        self.remove_calls.append(binding)
+        return self.remove_result
 
 
 @pytest.fixture
-def mock_config_manager():
-    """Create mock ConfigManager."""
-    config_manager = Mock(spec=ConfigManager)
-    # Mock successful operations by default
-    config_manager.add_binding.return_value = OperationResult(success=True)
-    config_manager.remove_binding.return_value = OperationResult(success=True)
-    return config_manager
+def stub_config_manager():
+    """Create a recording stand-in for ConfigManager."""
+    return _StubConfigManager()
+
+
+@pytest.fixture(scope="class")
+def fresh_manager():
+    """Untouched ModeManager shared by a class of read-only tests.
+
+    Tests using it must not switch modes or apply bindings.
+    """
+    return ModeManager(_StubConfigManager())
+
+
+# Built once; Binding is frozen and no test mutates its modifiers
+SAMPLE_BINDING = Binding(
+    type=BindType.BINDD,
+    modifiers=["$mainMod"],
+    key="Q",
+    description="Close active window",
+    action="killactive",
+    params="",
+    submap=None,
+    line_number=1,
+    category="Window Management",
+)
 
 
 @pytest.fixture
 def sample_binding():
-    """Create sample binding for tests."""
-    return Binding(
-        type=BindType.BINDD,
-        modifiers=["$mainMod"],
-        key="Q",
-        description="Close active window",
-        action="killactive",
-        params="",
-        submap=None,
-        line_number=1,
-        category="Window Management",
-    )
+    """Shared sample binding for tests."""
+    return SAMPLE_BINDING
+
+
+def _force_mode(manager, mode):
+    """Set a manager's mode directly, bypassing the availability check."""
+    object.__setattr__(manager, "current_mode", mode)
 
 
 class TestModeEnum:
@@ -47,75 +82,69 @@ class TestModeEnum:
 class TestModeManagerInitialization:
     """Test ModeManager initialization."""
 
-    def test_init_defaults_to_safe_mode(self, mock_config_manager):
+    def test_init_defaults_to_safe_mode(self, fresh_manager):
         """ModeManager should default to Safe mode."""
-        manager = ModeManager(mock_config_manager)
-        assert manager.get_mode() == Mode.SAFE
+        assert fresh_manager.get_mode() == Mode.SAFE
 
-    def test_init_stores_config_manager(self, mock_config_manager):
+    def test_init_stores_config_manager(self, stub_config_manager):
         """ModeManager should store config manager reference."""
-        manager = ModeManager(mock_config_manager)
-        assert manager.config_manager is mock_config_manager
+        manager = ModeManager(stub_config_manager)
+        assert manager.config_manager is stub_config_manager
 
-    def test_init_hyprland_client_none(self, mock_config_manager):
+    def test_init_hyprland_client_none(self, fresh_manager):
         """HyprlandClient should be None until needed."""
-        manager = ModeManager(mock_config_manager)
-        assert manager._hyprland_client is None
+        assert fresh_manager._hyprland_client is None
 
 
 class TestModeGetting:
     """Test getting current mode."""
 
-    def test_get_mode_returns_safe_by_default(self, mock_config_manager):
+    def test_get_mode_returns_safe_by_default(self, fresh_manager):
         """get_mode() should return SAFE by default."""
-        manager = ModeManager(mock_config_manager)
-        assert manager.get_mode() == Mode.SAFE
+        assert fresh_manager.get_mode() == Mode.SAFE
 
 
 class TestModeSwitching:
     """Test switching between modes."""
 
-    def test_set_mode_to_safe(self, mock_config_manager):
+    def test_set_mode_to_safe(self, stub_config_manager):
         """Should be able to set mode to SAFE."""
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         result = manager.set_mode(Mode.SAFE)
         assert result is True
         assert manager.get_mode() == Mode.SAFE
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_set_mode_to_live_when_available(
-        self, mock_client_class, mock_config_manager
+        self, patched_hyprland_client, stub_config_manager
     ):
         """Should set mode to LIVE when Hyprland is running."""
         # Mock Hyprland as running
-        mock_client_class.is_running.return_value = True
+        patched_hyprland_client.running = True
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         result = manager.set_mode(Mode.LIVE)
 
         assert result is True
         assert manager.get_mode() == Mode.LIVE
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_set_mode_to_live_when_unavailable(
-        self, mock_client_class, mock_config_manager
+        self, patched_hyprland_client, stub_config_manager
     ):
         """Should fail to set LIVE mode when Hyprland not running."""
         # Mock Hyprland as not running
-        mock_client_class.is_running.return_value = False
+        patched_hyprland_client.running = False
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         result = manager.set_mode(Mode.LIVE)
 
         assert result is False
         assert manager.get_mode() == Mode.SAFE  # Should stay in SAFE
 
-    def test_switch_from_live_to_safe(self, mock_config_manager):
+    def test_switch_from_live_to_safe(self, stub_config_manager):
         """Should be able to switch from LIVE back to SAFE."""
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
 
-        # Force mode to LIVE (bypassing availability check for test)
-        manager.current_mode = Mode.LIVE
+        _force_mode(manager, Mode.LIVE)
 
         result = manager.set_mode(Mode.SAFE)
         assert result is True
@@ -125,24 +154,22 @@ class TestModeSwitching:
 class TestLiveModeAvailability:
     """Test checking if Live mode is available."""
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_is_live_available_when_running(
-        self, mock_client_class, mock_config_manager
+        self, patched_hyprland_client, stub_config_manager
     ):
         """is_live_available() should return True when Hyprland running."""
-        mock_client_class.is_running.return_value = True
+        patched_hyprland_client.running = True
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         assert manager.is_live_available() is True
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_is_live_available_when_not_running(
-        self, mock_client_class, mock_config_manager
+        self, patched_hyprland_client, stub_config_manager
     ):
         """is_live_available() should return False when Hyprland not running."""
-        mock_client_class.is_running.return_value = False
+        patched_hyprland_client.running = False
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         assert manager.is_live_available() is False
 
 
@@ -150,40 +177,44 @@ class TestApplyBindingInSafeMode:
     """Test applying bindings in Safe mode."""
 
     def test_apply_binding_add_in_safe_mode(
-        self, mock_config_manager, sample_binding
+        self, stub_config_manager, sample_binding
     ):
         """Adding binding in Safe mode should call config_manager.add_binding()."""
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.SAFE)
 
         result = manager.apply_binding(sample_binding, "add")
 
         assert result.success is True
-        mock_config_manager.add_binding.assert_called_once_with(sample_binding)
-        mock_config_manager.remove_binding.assert_not_called()
+        assert (stub_config_manager.add_calls, stub_config_manager.remove_calls) == (
+            [sample_binding],
+            [],
+        )
 
     def test_apply_binding_remove_in_safe_mode(
-        self, mock_config_manager, sample_binding
+        self, stub_config_manager, sample_binding
     ):
         """Removing binding in Safe mode should call config_manager.remove_binding()."""
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.SAFE)
 
         result = manager.apply_binding(sample_binding, "remove")
 
         assert result.success is True
-        mock_config_manager.remove_binding.assert_called_once_with(sample_binding)
-        mock_config_manager.add_binding.assert_not_called()
+        assert (stub_config_manager.add_calls, stub_config_manager.remove_calls) == (
+            [],
+            [sample_binding],
+        )
 
     def test_apply_binding_safe_mode_failure(
-        self, mock_config_manager, sample_binding
+        self, stub_config_manager, sample_binding
     ):
         """Safe mode should propagate failures from config_manager."""
-        mock_config_manager.add_binding.return_value = OperationResult(
+        stub_config_manager.add_result = OperationResult(
             success=False, message="Conflict detected"
         )
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         result = manager.apply_binding(sample_binding, "add")
 
         assert result.success is False
@@ -193,104 +224,52 @@ class TestApplyBindingInSafeMode:
 class TestApplyBindingInLiveMode:
     """Test applying bindings in Live mode."""
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
-    def test_apply_binding_add_in_live_mode(
-        self, mock_client_class, mock_config_manager, sample_binding
-    ):
-        """Adding binding in Live mode should use IPC, not file write."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client.add_binding.return_value = True
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
-        manager.set_mode(Mode.LIVE)
-
-        result = manager.apply_binding(sample_binding, "add")
-
-        # Should use IPC, not config_manager
-        assert result.success is True
-        assert "IPC" in result.message or "not saved" in result.message
-        mock_client.connect.assert_called_once()
-        mock_client.add_binding.assert_called_once_with(sample_binding)
-        mock_config_manager.add_binding.assert_not_called()
-
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
-    def test_apply_binding_remove_in_live_mode(
-        self, mock_client_class, mock_config_manager, sample_binding
+    @pytest.mark.parametrize(
+        ("action", "client_results", "expect_ok", "expect_msg"),
+        [
+            ("add", {}, True, "not saved"),
+            ("remove", {}, True, "not saved"),
+            ("add", {"connect": False}, False, "Failed to connect"),
+            ("add", {"add": False}, False, "IPC command failed"),
+        ],
+        ids=["add", "remove", "connection-failure", "command-failure"],
+    )
+    def test_live_mode_matrix(
+        self,
+        patched_hyprland_client,
+        stub_config_manager,
+        sample_binding,
+        action,
+        client_results,
+        expect_ok,
+        expect_msg,
     ):
-        """Removing binding in Live mode should use IPC, not file write."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client.remove_binding.return_value = True
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
-        manager.set_mode(Mode.LIVE)
-
-        result = manager.apply_binding(sample_binding, "remove")
+        """Live mode applies bindings over IPC only and reports IPC failures."""
+        client = FakeHyprlandClient(**client_results)
+        patched_hyprland_client.instance = client
+        patched_hyprland_client.running = True
 
-        # Should use IPC, not config_manager
-        assert result.success is True
-        mock_client.remove_binding.assert_called_once_with(sample_binding)
-        mock_config_manager.remove_binding.assert_not_called()
-
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
-    def test_live_mode_connection_failure(
-        self, mock_client_class, mock_config_manager, sample_binding
-    ):
-        """Live mode should handle IPC connection failures."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = False
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.LIVE)
 
-        result = manager.apply_binding(sample_binding, "add")
+        result = manager.apply_binding(sample_binding, action)
 
-        assert result.success is False
-        assert "Failed to connect" in result.message
+        assert result.success is expect_ok
+        assert expect_msg in result.message
+        if client_results.get("connect", True):
+            assert client.calls == [("connect",), (action, sample_binding)]
+        # Never falls back to a file write
+        assert (stub_config_manager.add_calls, stub_config_manager.remove_calls) == ([], [])
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
-    def test_live_mode_ipc_command_failure(
-        self, mock_client_class, mock_config_manager, sample_binding
-    ):
-        """Live mode should handle IPC command failures."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client.add_binding.return_value = False  # Command fails
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
-        manager.set_mode(Mode.LIVE)
-
-        result = manager.apply_binding(sample_binding, "add")
-
-        assert result.success is False
-        assert "IPC command failed" in result.message
-
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_live_mode_reuses_client(
-        self, mock_client_class, mock_config_manager, sample_binding
+        self, patched_hyprland_client, stub_config_manager, sample_binding
     ):
         """Live mode should reuse HyprlandClient instance."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client.add_binding.return_value = True
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
+        client = FakeHyprlandClient()
+        patched_hyprland_client.instance = client
+        patched_hyprland_client.running = True
+
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.LIVE)
 
         # Apply two bindings
@@ -298,22 +277,23 @@ class TestApplyBindingInLiveMode:
         manager.apply_binding(sample_binding, "remove")
 
         # Should only create client once and connect once
-        assert mock_client_class.call_count == 1
-        assert mock_client.connect.call_count == 1
+        assert patched_hyprland_client.call_count == 1
+        assert client.calls == [
+            ("connect",),
+            ("add", sample_binding),
+            ("remove", sample_binding),
+        ]
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_live_mode_exception_handling(
-        self, mock_client_class, mock_config_manager, sample_binding
+        self, patched_hyprland_client, stub_config_manager, sample_binding
     ):
         """Live mode should handle exceptions gracefully."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client.add_binding.side_effect = Exception("IPC socket error")
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
-
-        manager = ModeManager(mock_config_manager)
+        patched_hyprland_client.instance = FakeHyprlandClient(
+            add=Exception("IPC socket error")
+        )
+        patched_hyprland_client.running = True
+
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.LIVE)
 
         result = manager.apply_binding(sample_binding, "add")
@@ -327,34 +307,30 @@ class TestInvalidAction:
     """Test handling of invalid actions."""
 
     def test_invalid_action_in_safe_mode(
-        self, mock_config_manager, sample_binding
+        self, stub_config_manager, sample_binding
     ):
         """Invalid action in Safe mode should return None or handle gracefully."""
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
 
         # This should either return None or an error result
         result = manager.apply_binding(sample_binding, "invalid_action")
 
         # Should not call any config_manager methods
-        mock_config_manager.add_binding.assert_not_called()
-        mock_config_manager.remove_binding.assert_not_called()
+        assert (stub_config_manager.add_calls, stub_config_manager.remove_calls) == ([], [])
 
-    @patch("hyprbind.ipc.hyprland_client.HyprlandClient")
     def test_invalid_action_in_live_mode(
-        self, mock_client_class, mock_config_manager, sample_binding
+        self, patched_hyprland_client, stub_config_manager, sample_binding
     ):
         """Invalid action in Live mode should handle gracefully."""
-        mock_client = MagicMock()
-        mock_client.connect.return_value = True
-        mock_client_class.return_value = mock_client
-        mock_client_class.is_running.return_value = True
+        client = FakeHyprlandClient()
+        patched_hyprland_client.instance = client
+        patched_hyprland_client.running = True
 
-        manager = ModeManager(mock_config_manager)
+        manager = ModeManager(stub_config_manager)
         manager.set_mode(Mode.LIVE)
 
         # This should either return None or an error result
         result = manager.apply_binding(sample_binding, "invalid_action")
 
         # Should not call any IPC methods
-        mock_client.add_binding.assert_not_called()
-        mock_client.remove_binding.assert_not_called()
+        assert client.calls == []
@@ -1,5 +1,18 @@
+"""Tests for core data models."""
+
+import dataclasses
+import os
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+
 import pytest
-from hyprbind.core.models import BindType
+
+import hyprbind
+from hyprbind.core.models import Binding, BindType, Category, Config
+
+pytestmark = pytest.mark.unit
 
 
 def test_bind_type_enum_values():
@@ -10,9 +23,6 @@ def test_bind_type_enum_values():
     assert BindType.BINDM.value == "bindm"
 
 
-from hyprbind.core.models import Binding, BindType
-
-
 def test_binding_creation():
     """Test creating a Binding instance."""
     binding = Binding(
@@ -126,9 +136,6 @@ def test_binding_no_conflict_different_key():
     assert not binding1.conflicts_with(binding2)
 
 
-from hyprbind.core.models import Category, Config
-
-
 def test_category_creation():
     """Test creating Category."""
     category = Category(name="Window Management", icon="window-symbolic")
@@ -243,6 +250,51 @@ def test_binding_conflict_key_different_modifier_order():
     assert binding1.conflict_key == binding2.conflict_key
 
 
+def test_binding_conflict_key_ignores_builtin_modifier_case():
+    """Builtin modifiers compare case-insensitively; $variables do not."""
+    def build(modifiers):
+        return Binding(
+            type=BindType.BIND,
+            modifiers=modifiers,
+            key="Q",
+            description="",
+            action="exec",
+            params="",
+            submap=None,
+            line_number=1,
+            category="Window",
+        )
+
+    lower = build(["super", "shift"])
+    upper = build(["SHIFT", "SUPER"])
+
+    assert lower.conflict_key == upper.conflict_key
+    assert lower.conflicts_with(upper)
+    assert lower.modifiers == ["super", "shift"]  # Stored as written
+    assert build(["$mainmod"]).conflict_key != build(["$mainMod"]).conflict_key
+
+
+def test_binding_conflict_key_shares_canonical_modifier_tuple():
+    """Bindings with the same modifier list share one deduplicated tuple."""
+    def build(key):
+        return Binding(
+            type=BindType.BIND,
+            modifiers=["SHIFT", "$mainMod", "SHIFT"],
+            key=key,
+            description="",
+            action="exec",
+            params="",
+            submap=None,
+            line_number=1,
+            category="Window",
+        )
+
+    first, second = build("Q"), build("W")
+
+    assert first.conflict_key[0] == ("$mainMod", "SHIFT")
+    assert first.conflict_key[0] is second.conflict_key[0]
+
+
 def test_binding_conflict_key_with_submap():
     """Test conflict_key includes submap."""
     binding = Binding(
@@ -261,6 +313,146 @@ def test_binding_conflict_key_with_submap():
     assert binding.conflict_key == expected_key
 
 
+def test_binding_conflict_key_is_precomputed_and_hashable():
+    """conflict_key is fixed at construction and drives the binding's hash."""
+    binding = Binding(
+        type=BindType.BIND,
+        modifiers=["SHIFT", "$mainMod"],
+        key="Q",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+
+    assert binding.conflict_key is binding.conflict_key
+    assert hash(binding) == hash(binding.conflict_key)
+    assert len({binding, dataclasses.replace(binding)}) == 1
+
+    moved = dataclasses.replace(binding, key="W")
+    assert moved.conflict_key == (("$mainMod", "SHIFT"), "W", None)
+
+    restored = pickle.loads(pickle.dumps(binding))
+    assert restored == binding
+    assert restored.conflict_key == binding.conflict_key
+
+
+_PICKLE_ROUND_TRIP = """
+import pickle, sys
+from hyprbind.core.models import Binding, BindType
+
+fresh = Binding(BindType.BIND, ["$mainMod"], "Q", "", "exec", "", None, 1, "Window")
+if sys.argv[1] == "dump":
+    sys.stdout.buffer.write(pickle.dumps(fresh))
+else:
+    restored = pickle.loads(sys.stdin.buffer.read())
+    assert hash(restored) == hash(fresh)
+    assert restored == fresh
+    assert restored in {fresh}
+"""
+
+
+def test_binding_hash_is_recomputed_when_unpickled_under_another_seed():
+    """A pickled binding stays equal and hash-compatible across hash seeds."""
+    src = str(Path(hyprbind.__file__).resolve().parents[1])
+
+    def run(mode, seed, data=b""):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=src)
+        return subprocess.run(
+            [sys.executable, "-c", _PICKLE_ROUND_TRIP, mode],
+            input=data, env=env, capture_output=True, check=True,
+        ).stdout
+
+    run("load", "2", run("dump", "1"))
+
+
+def test_binding_is_slotted_and_frozen():
+    """Bindings carry no per-instance __dict__ and reject field assignment."""
+    binding = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod"],
+        key="Q",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+
+    assert not hasattr(binding, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        binding.key = "W"
+
+
+def test_binding_equality_is_field_wise():
+    """Equal fields compare equal; any differing field (incl. order) does not."""
+    binding = Binding(
+        type=BindType.BIND,
+        modifiers=["SHIFT", "$mainMod"],
+        key="Q",
+        description="Close",
+        action="killactive",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+
+    assert binding == dataclasses.replace(binding)
+    assert binding != dataclasses.replace(binding, description="Other")
+    assert binding != dataclasses.replace(binding, key="W")
+    assert binding != dataclasses.replace(binding, modifiers=["$mainMod", "SHIFT"])
+    assert binding != "not a binding"
+
+
+def test_binding_interns_repeated_strings():
+    """Equal key, modifier, submap and category strings share one object."""
+    def build():
+        # Build each string at runtime so the literals are not pre-shared
+        return Binding(
+            type=BindType.BIND,
+            modifiers=["".join(["$main", "Mod"])],
+            key="".join(["Q", "W"]),
+            description="",
+            action="exec",
+            params="",
+            submap="".join(["res", "ize"]),
+            line_number=1,
+            category="".join(["Win", "dow"]),
+        )
+
+    first, second = build(), build()
+
+    assert first.key is second.key
+    assert first.modifiers[0] is second.modifiers[0]
+    assert first.submap is second.submap
+    assert first.category is second.category
+
+
+def test_binding_accepts_tuple_modifiers():
+    """Tuple modifiers are stored as a list and match the list-built binding."""
+    modifiers = ("$mainMod", "SHIFT")
+    from_tuple = Binding(
+        type=BindType.BIND,
+        modifiers=modifiers,
+        key="Q",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Apps",
+    )
+    from_list = dataclasses.replace(from_tuple, modifiers=list(modifiers))
+
+    assert from_tuple.modifiers == ["$mainMod", "SHIFT"]
+    assert from_tuple == from_list
+    assert from_tuple.conflict_key[0] is from_list.conflict_key[0]
+
+
 def test_config_binding_index_created():
     """Test binding index is maintained when adding bindings."""
     config = Config()
@@ -316,6 +508,49 @@ def test_config_find_conflict_returns_binding():
     assert conflict == existing
 
 
+def test_config_has_conflict():
+    """has_conflict reports index membership without returning the binding."""
+    config = Config()
+    existing = Binding(
+        type=BindType.BIND,
+        modifiers=["SHIFT", "$mainMod"],
+        key="Q",
+        description="",
+        action="killactive",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+    config.add_binding(existing)
+
+    reordered = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod", "SHIFT"],
+        key="Q",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=2,
+        category="Window",
+    )
+    other_key = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod", "SHIFT"],
+        key="W",
+        description="",
+        action="exec",
+        params="",
+        submap=None,
+        line_number=3,
+        category="Window",
+    )
+
+    assert config.has_conflict(reordered) is True
+    assert config.has_conflict(other_key) is False
+
+
 def test_config_find_conflict_returns_none_when_no_conflict():
     """Test find_conflict returns None when no conflict exists."""
     config = Config()
@@ -411,3 +646,55 @@ def test_config_rebuild_index():
     assert len(config._binding_index) == 2
     assert config.find_conflict(binding1) == binding1
     assert config.find_conflict(binding2) == binding2
+
+
+def test_config_binding_index_is_read_only_view():
+    """binding_index reflects add/remove but cannot be mutated."""
+    config = Config()
+    binding = Binding(
+        type=BindType.BIND,
+        modifiers=["$mainMod"],
+        key="Q",
+        description="",
+        action="killactive",
+        params="",
+        submap=None,
+        line_number=1,
+        category="Window",
+    )
+    index = config.binding_index
+
+    config.add_binding(binding)
+    assert index[binding.conflict_key] is binding
+
+    with pytest.raises(TypeError):
+        index[binding.conflict_key] = binding
+
+    config.remove_binding(binding)
+    assert binding.conflict_key not in index
+
+
+def test_config_from_bindings_matches_add_binding():
+    """from_bindings gives the same categories and last-wins index as add_binding."""
+    def build(key, category, line_number):
+        return Binding(
+            type=BindType.BIND,
+            modifiers=["$mainMod"],
+            key=key,
+            description="",
+            action="exec",
+            params="",
+            submap=None,
+            line_number=line_number,
+            category=category,
+        )
+
+    bindings = [build("Q", "Window", 1), build("W", "Apps", 2), build("Q", "Apps", 3)]
+
+    built = Config.from_bindings(bindings, file_path="test.conf")
+    added = Config(file_path="test.conf")
+    for binding in bindings:
+        added.add_binding(binding)
+
+    assert built == added
+    assert built.find_conflict(bindings[0]) is bindings[2]
@@ -1,7 +1,7 @@
 """Tests for core/sanitizers.py module."""
 
 import pytest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from hyprbind.core.sanitizers import IPCSanitizer, CONTROL_CHARS
 
@@ -96,13 +96,13 @@ class TestIPCSanitizerValidateBinding:
     @pytest.fixture
     def mock_binding(self):
         """Create a mock binding for testing."""
-        binding = MagicMock()
-        binding.key = "Return"
-        binding.action = "exec"
-        binding.params = "kitty"
-        binding.description = "Open terminal"
-        binding.modifiers = ["SUPER", "SHIFT"]
-        return binding
+        return SimpleNamespace(
+            key="Return",
+            action="exec",
+            params="kitty",
+            description="Open terminal",
+            modifiers=["SUPER", "SHIFT"],
+        )
 
     def test_valid_binding_returns_none(self, mock_binding):
         result = IPCSanitizer.validate_binding(mock_binding)
@@ -51,6 +51,26 @@ bindd = $mainMod, V, Float, togglefloating,
     assert "Test Category" in config.categories
 
 
+def test_parsed_config_index_is_complete_and_stays_editable():
+    """Parsing fills the conflict index, and the result can still be edited."""
+    content = """
+# ======= Test Category =======
+bindd = $mainMod, Q, Close, killactive,
+bindd = $mainMod, V, Float, togglefloating,
+"""
+
+    config = ConfigParser.parse_string(content)
+    close, float_ = config.get_all_bindings()
+
+    assert dict(config.binding_index) == {
+        close.conflict_key: close,
+        float_.conflict_key: float_,
+    }
+
+    config.remove_binding(close)
+    assert config.find_conflict(close) is None
+
+
 def test_parse_empty_file():
     """Test parsing empty config."""
     config = ConfigParser.parse_string("")
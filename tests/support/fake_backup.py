@@ -0,0 +1,35 @@
+"""In-memory stand-in for BackupManager in tests that don't inspect backups."""
+
+from pathlib import Path
+from typing import List, Tuple
+
+from hyprbind.core.backup_manager import BackupInfo
+
+
+class FakeBackupManager:
+    """Records backup calls without touching the filesystem."""
+
+    def __init__(self) -> None:
+        """Initialize with an empty call log."""
+        self.calls: List[Tuple[str, Path]] = []
+
+    def create_backup(self, config_path: Path, skip_validation: bool = False) -> Path:
+        """Record the backup and return the path it would have used."""
+        self.calls.append(("create_backup", config_path))
+        return config_path.with_name(f"{config_path.name}.fake.backup")
+
+    def list_backups(self, config_path: Path) -> List[BackupInfo]:
+        """Report no backups."""
+        self.calls.append(("list_backups", config_path))
+        return []
+
+    def restore_backup(
+        self, backup_path: Path, target_path: Path, skip_validation: bool = False
+    ) -> None:
+        """Record the restore request."""
+        self.calls.append(("restore_backup", backup_path))
+
+    def cleanup_old_backups(self, config_path: Path, keep: int = 0) -> int:
+        """Record the cleanup request; nothing is ever deleted."""
+        self.calls.append(("cleanup_old_backups", config_path))
+        return 0
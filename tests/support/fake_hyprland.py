@@ -0,0 +1,62 @@
+"""Plain stand-ins for HyprlandClient in tests that never touch the socket."""
+
+from typing import Any, List, Tuple
+
+
+class FakeHyprlandClientClass:
+    """Replaces the HyprlandClient class; hands out one preset instance."""
+
+    def __init__(self) -> None:
+        """Start with Hyprland reported as not running and no instance."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the configured state and construction count."""
+        self.running = False
+        self.instance: Any = None
+        self.call_count = 0
+
+    def is_running(self) -> bool:
+        """Report the configured running state."""
+        return self.running
+
+    def __call__(self) -> Any:
+        """Count the construction and return the preset instance."""
+        self.call_count += 1
+        return self.instance
+
+
+class FakeHyprlandClient:
+    """Records IPC calls and returns preset results.
+
+    A result that is an exception instance is raised instead of returned.
+    """
+
+    def __init__(self, connect: bool = True, add: Any = True, remove: Any = True) -> None:
+        """Set the results for connect(), add_binding() and remove_binding()."""
+        self.connect_result = connect
+        self.add_result = add
+        self.remove_result = remove
+        self.calls: List[Tuple[Any, ...]] = []
+
+    def connect(self) -> bool:
+        """Record the connection attempt."""
+        self.calls.append(("connect",))
+        return self.connect_result
+
+    def add_binding(self, binding: Any) -> bool:
+        """Record the add request."""
+        self.calls.append(("add", binding))
+        return self._result(self.add_result)
+
+    def remove_binding(self, binding: Any) -> bool:
+        """Record the remove request."""
+        self.calls.append(("remove", binding))
+        return self._result(self.remove_result)
+
+    @staticmethod
+    def _result(result: Any) -> bool:
+        """Return the preset result, raising it if it is an exception."""
+        if isinstance(result, Exception):
+            raise result
+        return result
@@ -0,0 +1,12 @@
+"""Minimal keybinds.conf seed for tests that only need a parsable file."""
+
+from pathlib import Path
+
+SEED = "bind = SUPER, A, exec, app\n"
+
+
+def write_seed(directory: Path, content: str = SEED) -> Path:
+    """Write keybinds.conf into directory and return its path."""
+    config_file = directory / "keybinds.conf"
+    config_file.write_text(content)
+    return config_file
@@ -347,3 +347,45 @@ class TestWallustLoader:
         for i in range(16):
             color_attr = getattr(palette, f"color{i}")
             assert color_attr == f"#{i:02x}{i:02x}{i:02x}"
+
+
+class TestPaletteCache:
+    """Test cached palette used for fast startup theming."""
+
+    def test_cache_file_uses_xdg_cache_home(self):
+        """Cache file lives under XDG_CACHE_HOME when set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir}):
+                assert WallustLoader.cache_file() == (
+                    Path(tmpdir) / "hyprbind" / "wallust_palette.json"
+                )
+
+    def test_save_and_load_cached_colors(self):
+        """Saved palette round-trips through the cache file."""
+        palette = ColorPalette(
+            background="#1e1e2e",
+            foreground="#cdd6f4",
+            accent="#89b4fa",
+            color2="#a6e3a1",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir}):
+                assert WallustLoader.save_cached_colors(palette) is True
+                assert WallustLoader.load_cached_colors() == palette
+
+    def test_load_cached_colors_missing_file(self):
+        """Return None when no cache has been written yet."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir}):
+                assert WallustLoader.load_cached_colors() is None
+
+    def test_load_cached_colors_corrupt_file(self):
+        """Return None when cache file is not valid JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = Path(tmpdir) / "hyprbind" / "wallust_palette.json"
+            cache_file.parent.mkdir(parents=True)
+            cache_file.write_text("not json")
+
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir}):
+                assert WallustLoader.load_cached_colors() is None
@@ -0,0 +1,80 @@
+"""Tests for the ConfigManager change signal bridge."""
+
+import threading
+
+import pytest
+
+from hyprbind._gi_bootstrap import GLib
+from hyprbind.core.config_manager import ConfigManager
+from hyprbind.ui.config_signals import ConfigChangeNotifier
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """ConfigManager on an isolated temp path."""
+    config_file = tmp_path / "keybinds.conf"
+    config_file.write_text("# test\n")
+    return ConfigManager(config_file, skip_validation=True)
+
+
+def _drain_main_context() -> None:
+    """Run pending idle callbacks."""
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+def test_for_manager_returns_same_notifier(manager):
+    """One notifier is shared per ConfigManager."""
+    assert ConfigChangeNotifier.for_manager(manager) is ConfigChangeNotifier.for_manager(manager)
+
+
+def test_notifier_registers_single_observer(manager):
+    """Connecting several handlers adds only one observer to the manager."""
+    initial_count = len(manager._observers)
+
+    notifier = ConfigChangeNotifier.for_manager(manager)
+    notifier.connect("changed", lambda _n: None)
+    notifier.connect("changed", lambda _n: None)
+
+    assert len(manager._observers) == initial_count + 1
+
+
+def test_changed_emitted_once_per_burst(manager):
+    """Several notifications before the main loop runs emit "changed" once."""
+    calls = []
+    ConfigChangeNotifier.for_manager(manager).connect("changed", lambda _n: calls.append(1))
+
+    manager._notify_observers()
+    manager._notify_observers()
+    manager._notify_observers()
+    _drain_main_context()
+
+    assert calls == [1]
+
+    manager._notify_observers()
+    _drain_main_context()
+
+    assert calls == [1, 1]
+
+
+def test_concurrent_notifications_emit_once(manager):
+    """Notifications racing in from worker threads schedule one emission."""
+    calls = []
+    ConfigChangeNotifier.for_manager(manager).connect("changed", lambda _n: calls.append(1))
+
+    start = threading.Barrier(8)
+
+    def notify():
+        start.wait()
+        for _ in range(50):
+            manager._notify_observers()
+
+    threads = [threading.Thread(target=notify) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _drain_main_context()
+
+    assert calls == [1]
@@ -61,16 +61,6 @@ class TestWindowStructure:
         assert hasattr(main_window, "cheatsheet_tab")
         assert hasattr(main_window, "reference_tab")
 
-    def test_has_header_bar(self, main_window):
-        """Window has header bar."""
-        assert hasattr(main_window, "header_bar")
-        assert isinstance(main_window.header_bar, Adw.HeaderBar)
-
-    def test_has_main_content(self, main_window):
-        """Window has main content box."""
-        assert hasattr(main_window, "main_content")
-        assert isinstance(main_window.main_content, Gtk.Box)
-
 
 # =============================================================================
 # Tab Structure Tests
@@ -258,6 +248,13 @@ class TestAsyncLoading:
         main_window._hide_loading()
         assert not main_window.loading_box.get_visible()
 
+    def test_loading_spinner_only_spins_while_visible(self, main_window):
+        """Spinner is started on show and stopped on hide."""
+        main_window._show_loading()
+        assert main_window.loading_spinner.get_spinning()
+        main_window._hide_loading()
+        assert not main_window.loading_spinner.get_spinning()
+
     def test_has_config_loaded_callback(self, main_window):
         """Window has config loaded callback."""
         assert hasattr(main_window, "_on_config_loaded")
@@ -6,7 +6,8 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 import pytest
 
-from hyprbind.ui.reference_tab import ReferenceTab
+from hyprbind.data.hyprland_reference import HYPRLAND_ACTIONS
+from hyprbind.ui.reference_tab import REFERENCE_ACTIONS, ReferenceTab
 
 
 def test_reference_tab_has_search_entry():
@@ -84,6 +85,18 @@ def test_reference_tab_displays_actions():
     assert model.get_n_items() > 0, "Model should have items"
 
 
+def test_reference_tab_lists_every_action_once():
+    """Each reference action gets its own row, in data order."""
+    tab = ReferenceTab()
+
+    rows = [tab.list_store.get_string(i) for i in range(tab.list_store.get_n_items())]
+
+    assert len(rows) == len(HYPRLAND_ACTIONS)
+    assert rows == [action.search_key for action in REFERENCE_ACTIONS]
+    # Rows are bound by search string, so duplicates would show the wrong action
+    assert len(set(rows)) == len(rows)
+
+
 def test_reference_tab_has_filter_model():
     """Reference tab uses FilterListModel for search."""
     tab = ReferenceTab()
@@ -140,3 +153,16 @@ def test_reference_tab_empty_search_shows_all():
     filtered_count = tab.filter_model.get_n_items()
 
     assert filtered_count == total_actions, "Empty search should show all actions"
+
+
+def test_reference_tab_empty_search_skips_filtering():
+    """Empty search lets the filter model pass items through without matching."""
+    tab = ReferenceTab()
+
+    tab.search_entry.set_text("exec")
+    tab._on_search_changed(tab.search_entry)
+    assert tab.filter.get_strictness() == Gtk.FilterMatch.SOME
+
+    tab.search_entry.set_text("")
+    tab._on_search_changed(tab.search_entry)
+    assert tab.filter.get_strictness() == Gtk.FilterMatch.ALL